@@ -5,12 +5,14 @@ Argument mining service for identifying claims, premises, and evidence
 import asyncio
 from typing import List, Dict, Optional, Tuple
 import numpy as np
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import spacy
 from loguru import logger
 import re
+from collections import Counter
 
 from models.schemas import EvidenceType
+from services.shared_models import get_mnli_classifier, inference_device
 
 
 class Argument:
@@ -37,10 +39,32 @@ class ArgumentMiner:
     
     def __init__(self):
         self.nlp = None
-        self.argument_classifier = None
         self.relation_classifier = None
         self.discourse_parser = None
         
+        # Argument pairs further apart than this many sentences are only
+        # classified when a linking discourse marker lies between them
+        self.max_relation_distance = 5
+        
+        # Discourse markers that imply a relation between adjacent arguments:
+        # marker type -> (relation type, whether the earlier sentence is the source)
+        self.marker_relation_priors = {
+            'conclusion': ('supports', True),    # "A. Therefore, B." -> A supports B
+            'contrast': ('contradicts', False),  # "A. However, B." -> B contradicts A
+        }
+        self.marker_prior_confidence = 0.8
+        
+        # Micro-batch size for MNLI inference; inputs are length-sorted so
+        # each batch only pads to its own longest element
+        self.inference_batch_size = 16
+        
+        # Hypotheses used to classify argument components
+        self.component_hypotheses = {
+            'claim': "This sentence makes a main claim or assertion that needs support.",
+            'premise': "This sentence provides reasoning or evidence to support a claim.",
+            'evidence': "This sentence provides factual evidence, data, or empirical support."
+        }
+        
         # Initialize models
         asyncio.create_task(self._load_models())
     
@@ -49,22 +73,17 @@ class ArgumentMiner:
         try:
             logger.info("Loading argument mining models...")
             
-            # Load spaCy for text processing
-            self.nlp = spacy.load("en_core_web_sm")
-            
-            # Load argument component classifier
-            self.argument_classifier = pipeline(
-                "text-classification",
-                model="microsoft/DialoGPT-medium",
-                return_all_scores=True
+            # Load spaCy for sentence segmentation only; the standalone senter
+            # replaces the parser and no tagging, lemmas or NER are consumed
+            self.nlp = spacy.load(
+                "en_core_web_sm",
+                exclude=["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
             )
+            self.nlp.enable_pipe("senter")
             
-            # Load relation classifier for argument relations
-            self.relation_classifier = pipeline(
-                "text-classification",
-                model="facebook/bart-large-mnli",
-                return_all_scores=True
-            )
+            # MNLI classifier for argument components and relations, shared
+            # with the claim extractor
+            self.relation_classifier = get_mnli_classifier(inference_device())
             
             logger.info("Argument mining models loaded successfully")
             
@@ -89,13 +108,11 @@ class ArgumentMiner:
             # Extract sentences and discourse segments
             sentences = [sent.text.strip() for sent in doc.sents if len(sent.text.strip()) > 10]
             
-            # Identify argument components
+            # Identify argument components, classifying all sentences in one batch
             arguments = []
+            components = await self._classify_argument_components(sentences)
             
-            for i, sentence in enumerate(sentences):
-                # Classify argument type
-                arg_type, confidence = await self._classify_argument_component(sentence)
-                
+            for i, (sentence, (arg_type, confidence)) in enumerate(zip(sentences, components)):
                 if confidence >= confidence_threshold:
                     argument = Argument(
                         text=sentence,
@@ -112,7 +129,8 @@ class ArgumentMiner:
             # Extract relations between arguments if requested
             relations = []
             if extract_relations and len(arguments) > 1:
-                relations = await self._extract_argument_relations(arguments)
+                discourse_markers = await self.extract_discourse_markers(text)
+                relations = await self._extract_argument_relations(arguments, discourse_markers)
             
             processing_time = asyncio.get_event_loop().time() - start_time
             
@@ -151,58 +169,101 @@ class ArgumentMiner:
     
     async def _classify_argument_component(self, sentence: str) -> Tuple[str, float]:
         """Classify the type of argument component"""
+        return (await self._classify_argument_components([sentence]))[0]
+    
+    async def _classify_argument_components(self, sentences: List[str]) -> List[Tuple[str, float]]:
+        """Classify the argument component type of each sentence in a single batched pass"""
         try:
-            # Use multiple classifiers to determine argument type
-            
-            # Check if it's a claim
-            claim_hypothesis = "This sentence makes a main claim or assertion that needs support."
-            claim_result = self.relation_classifier(f"{sentence} [SEP] {claim_hypothesis}")
-            claim_score = max([item['score'] for item in claim_result[0] if item['label'] == 'ENTAILMENT'], default=0.0)
-            
-            # Check if it's a premise
-            premise_hypothesis = "This sentence provides reasoning or evidence to support a claim."
-            premise_result = self.relation_classifier(f"{sentence} [SEP] {premise_hypothesis}")
-            premise_score = max([item['score'] for item in premise_result[0] if item['label'] == 'ENTAILMENT'], default=0.0)
-            
-            # Check if it's evidence
-            evidence_hypothesis = "This sentence provides factual evidence, data, or empirical support."
-            evidence_result = self.relation_classifier(f"{sentence} [SEP] {evidence_hypothesis}")
-            evidence_score = max([item['score'] for item in evidence_result[0] if item['label'] == 'ENTAILMENT'], default=0.0)
-            
-            # Determine the most likely type
-            scores = {
-                'claim': claim_score,
-                'premise': premise_score,
-                'evidence': evidence_score
-            }
-            
-            best_type = max(scores, key=scores.get)
-            best_score = scores[best_type]
-            
-            return best_type, best_score
+            # Score every sentence against every component hypothesis
+            component_types = list(self.component_hypotheses)
+            inputs = [
+                f"{sentence} [SEP] {self.component_hypotheses[component_type]}"
+                for sentence in sentences
+                for component_type in component_types
+            ]
+            entailment_scores = self._entailment_scores(inputs)
+            
+            # Determine the most likely type for each sentence
+            components = []
+            for offset in range(0, len(inputs), len(component_types)):
+                scores = dict(zip(component_types, entailment_scores[offset:offset + len(component_types)]))
+                best_type = max(scores, key=scores.get)
+                components.append((best_type, scores[best_type]))
+            
+            return components
             
         except Exception as e:
             logger.error(f"Argument component classification failed: {e}")
-            return "claim", 0.0
+            return [("claim", 0.0)] * len(sentences)
     
-    async def _extract_argument_relations(self, arguments: List[Argument]) -> List[ArgumentRelation]:
+    def _entailment_scores(self, inputs: List[str]) -> List[float]:
+        """Run MNLI over inputs in length-sorted micro-batches and return entailment scores in input order"""
+        # Sort by character length (a cheap proxy for token count) so padding
+        # stays close to each micro-batch's own longest input
+        order = sorted(range(len(inputs)), key=lambda index: len(inputs[index]))
+        scores = [0.0] * len(inputs)
+        
+        for batch_start in range(0, len(order), self.inference_batch_size):
+            batch_indices = order[batch_start:batch_start + self.inference_batch_size]
+            results = self.relation_classifier(
+                [inputs[index] for index in batch_indices],
+                batch_size=len(batch_indices)
+            )
+            
+            for index, result in zip(batch_indices, results):
+                scores[index] = max(
+                    [item['score'] for item in result if item['label'] == 'ENTAILMENT'], default=0.0
+                )
+        
+        return scores
+    
+    async def _extract_argument_relations(
+        self,
+        arguments: List[Argument],
+        discourse_markers: Optional[List[Dict]] = None
+    ) -> List[ArgumentRelation]:
         """Extract relations between argument components"""
         relations = []
         
         try:
+            # Only markers with a relation prior are used to link arguments
+            linking_markers = [
+                marker for marker in discourse_markers or []
+                if marker['type'] in self.marker_relation_priors
+            ]
+            
             for i, arg1 in enumerate(arguments):
                 for j, arg2 in enumerate(arguments):
-                    if i != j:
+                    if i == j:
+                        continue
+                    
+                    distance = abs(arg1.position['sentence_id'] - arg2.position['sentence_id'])
+                    marker_types = self._markers_between(arg1, arg2, linking_markers)
+                    
+                    # Skip distant pairs with nothing linking them
+                    if distance > self.max_relation_distance and not marker_types:
+                        continue
+                    
+                    # Adjacent arguments joined by a marker take the relation from
+                    # the marker closest to the later argument
+                    relation_type, source_is_earlier = (
+                        self.marker_relation_priors[marker_types[0]] if marker_types else (None, None)
+                    )
+                    arg1_is_earlier = arg1.position['sentence_id'] < arg2.position['sentence_id']
+                    
+                    if distance == 1 and relation_type and arg1_is_earlier == source_is_earlier:
+                        confidence = self.marker_prior_confidence
+                    else:
                         relation_type, confidence = await self._classify_argument_relation(arg1, arg2)
-                        
-                        if confidence > 0.5:  # Threshold for relation confidence
-                            relation = ArgumentRelation(
-                                source_id=f"arg_{i}",
-                                target_id=f"arg_{j}",
-                                relation_type=relation_type,
-                                confidence=confidence
-                            )
-                            relations.append(relation)
+                    
+                    if confidence > 0.5:  # Threshold for relation confidence
+                        relation = ArgumentRelation(
+                            source_id=f"arg_{i}",
+                            target_id=f"arg_{j}",
+                            relation_type=relation_type,
+                            confidence=confidence
+                        )
+                        relations.append(relation)
             
             return relations
             
@@ -210,26 +271,30 @@ class ArgumentMiner:
             logger.error(f"Argument relation extraction failed: {e}")
             return []
     
+    def _markers_between(self, arg1: Argument, arg2: Argument, markers: List[Dict]) -> List[str]:
+        """Return types of markers between the end of the earlier argument and the end of the later one, closest to the later one first"""
+        earlier, later = sorted((arg1, arg2), key=lambda arg: arg.position['start'])
+        start, end = earlier.position['end'], later.position['end']
+        
+        between = [
+            marker for marker in markers
+            if start <= marker['position']['start'] < end
+        ]
+        # The marker nearest the later argument's start is the one that introduces it
+        between.sort(key=lambda marker: abs(marker['position']['start'] - later.position['start']))
+        return [marker['type'] for marker in between]
+    
     async def _classify_argument_relation(self, arg1: Argument, arg2: Argument) -> Tuple[str, float]:
         """Classify the relation between two argument components"""
         try:
-            # Check for support relation
+            # Check support, contradiction and elaboration relations in one batch
             support_hypothesis = f"The first statement supports or provides evidence for the second statement."
-            support_text = f"{arg1.text} [SEP] {arg2.text} [SEP] {support_hypothesis}"
-            support_result = self.relation_classifier(support_text)
-            support_score = max([item['score'] for item in support_result[0] if item['label'] == 'ENTAILMENT'], default=0.0)
-            
-            # Check for contradiction relation
             contradict_hypothesis = f"The first statement contradicts or opposes the second statement."
-            contradict_text = f"{arg1.text} [SEP] {arg2.text} [SEP] {contradict_hypothesis}"
-            contradict_result = self.relation_classifier(contradict_text)
-            contradict_score = max([item['score'] for item in contradict_result[0] if item['label'] == 'ENTAILMENT'], default=0.0)
-            
-            # Check for elaboration relation
             elaborate_hypothesis = f"The first statement elaborates or explains the second statement."
-            elaborate_text = f"{arg1.text} [SEP] {arg2.text} [SEP] {elaborate_hypothesis}"
-            elaborate_result = self.relation_classifier(elaborate_text)
-            elaborate_score = max([item['score'] for item in elaborate_result[0] if item['label'] == 'ENTAILMENT'], default=0.0)
+            support_score, contradict_score, elaborate_score = self._entailment_scores([
+                f"{arg1.text} [SEP] {arg2.text} [SEP] {hypothesis}"
+                for hypothesis in (support_hypothesis, contradict_hypothesis, elaborate_hypothesis)
+            ])
             
             # Determine the most likely relation
             scores = {
@@ -266,20 +331,30 @@ class ArgumentMiner:
                     argument_graph[rel['source']]['outgoing'].append(rel)
                     argument_graph[rel['target']]['incoming'].append(rel)
             
+            # Count argument and relation types in a single pass each
+            argument_types = Counter(arg['type'] for arg in arguments)
+            relation_types = Counter(rel['type'] for rel in relations)
+            
+            isolated_arguments = 0
+            well_supported_claims = 0
+            for arg_data in argument_graph.values():
+                if not arg_data['incoming'] and not arg_data['outgoing']:
+                    isolated_arguments += 1
+                elif arg_data['type'] == 'claim' and arg_data['incoming']:
+                    well_supported_claims += 1
+            
             # Analyze structure
             analysis = {
                 'argument_count': len(arguments),
                 'relation_count': len(relations),
-                'claim_count': len([arg for arg in arguments if arg['type'] == 'claim']),
-                'premise_count': len([arg for arg in arguments if arg['type'] == 'premise']),
-                'evidence_count': len([arg for arg in arguments if arg['type'] == 'evidence']),
-                'support_relations': len([rel for rel in relations if rel['type'] == 'supports']),
-                'contradiction_relations': len([rel for rel in relations if rel['type'] == 'contradicts']),
-                'elaboration_relations': len([rel for rel in relations if rel['type'] == 'elaborates']),
-                'isolated_arguments': len([arg_id for arg_id, arg_data in argument_graph.items() 
-                                         if not arg_data['incoming'] and not arg_data['outgoing']]),
-                'well_supported_claims': len([arg_id for arg_id, arg_data in argument_graph.items()
-                                            if arg_data['type'] == 'claim' and len(arg_data['incoming']) > 0])
+                'claim_count': argument_types['claim'],
+                'premise_count': argument_types['premise'],
+                'evidence_count': argument_types['evidence'],
+                'support_relations': relation_types['supports'],
+                'contradiction_relations': relation_types['contradicts'],
+                'elaboration_relations': relation_types['elaborates'],
+                'isolated_arguments': isolated_arguments,
+                'well_supported_claims': well_supported_claims
             }
             
             return analysis
@@ -300,7 +375,6 @@ class ArgumentMiner:
                 'support': ['furthermore', 'moreover', 'additionally', 'in addition', 'also', 'similarly']
             }
             
-            doc = self.nlp(text)
             markers_found = []
             
             for marker_type, markers in discourse_markers.items():
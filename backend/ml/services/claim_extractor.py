@@ -3,14 +3,18 @@ Claim extraction service using transformer models
 """
 
 import asyncio
+import re
+import threading
 from typing import List, Dict, Optional
 import numpy as np
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from sentence_transformers import SentenceTransformer
 import spacy
+import torch
 from loguru import logger
 
 from models.schemas import ClaimExtractionResponse, ExtractedClaim, ClaimType
+from services.shared_models import get_mnli_classifier, inference_device
 
 
 class ClaimExtractor:
@@ -24,6 +28,27 @@ class ClaimExtractor:
         self.claim_classifier = None
         self._initialized = False
 
+        # Classifier device (-1 for CPU) and per-thread CUDA streams so
+        # concurrent classifier calls overlap on the GPU
+        self._device = -1
+        self._stream_local = threading.local()
+
+        # Classifier inputs per length-sorted micro-batch
+        self.inference_batch_size = 16
+
+        # Whole-word cues for claim type heuristics
+        self.word_pattern = re.compile(r"[a-z]+")
+        self.question_words = frozenset({'what', 'how', 'why', 'when', 'where'})
+        self.hypothesis_words = frozenset({
+            'hypothesis', 'hypotheses', 'hypothesize', 'theory', 'theories',
+            'propose', 'proposes', 'proposed', 'suggest', 'suggests', 'suggested',
+            'might', 'could', 'may'
+        })
+
+        # Pipes skipped when only sentence boundaries are needed; the
+        # standalone senter does not listen to the shared tok2vec
+        self.sentence_disabled_pipes = ["tok2vec", "tagger", "attribute_ruler", "lemmatizer"]
+
     async def initialize(self):
         """Initialize models lazily. Call this before using the extractor."""
         if not self._initialized:
@@ -40,18 +65,18 @@ class ClaimExtractor:
         try:
             logger.info("Loading claim extraction models...")
             
-            # Load spaCy for text processing
-            self.nlp = spacy.load("en_core_web_sm")
+            # Load spaCy for text processing. Sentences come from the fast
+            # senter instead of the dependency parser, and NER is unused.
+            self.nlp = spacy.load("en_core_web_sm", exclude=["parser", "ner"])
+            self.nlp.enable_pipe("senter")
             
             # Load sentence transformer for similarity
             self.similarity_model = SentenceTransformer('all-MiniLM-L6-v2')
             
-            # Load claim classification pipeline
-            self.claim_classifier = pipeline(
-                "text-classification",
-                model="facebook/bart-large-mnli",
-                return_all_scores=True
-            )
+            # Load claim classification pipeline, on GPU when available. The
+            # MNLI pipeline is shared with the argument miner.
+            self._device = inference_device()
+            self.claim_classifier = get_mnli_classifier(self._device)
             
             logger.info("Claim extraction models loaded successfully")
             
@@ -72,48 +97,34 @@ class ClaimExtractor:
         start_time = asyncio.get_event_loop().time()
         
         try:
-            # Process text with spaCy
-            doc = self.nlp(text)
+            # Process text with spaCy (sentence segmentation only)
+            doc = await asyncio.to_thread(self.nlp, text, disable=self.sentence_disabled_pipes)
             
             # Extract sentences
             sentences = [sent.text.strip() for sent in doc.sents if len(sent.text.strip()) > 10]
             
-            claims = []
-            
-            for sentence in sentences:
-                # Classify if sentence contains a claim
-                claim_confidence = await self._classify_claim(sentence)
-                
-                if claim_confidence >= confidence_threshold:
-                    # Determine claim type
-                    claim_type = await self._classify_claim_type(sentence)
-                    
-                    # Extract keywords
-                    keywords = await self._extract_keywords(sentence)
-                    
-                    # Find related evidence if requested
-                    related_evidence = []
-                    if extract_evidence:
-                        related_evidence = await self._find_related_evidence(
-                            sentence, sentences
-                        )
-                    
-                    # Create claim object
-                    claim = ExtractedClaim(
-                        text=sentence,
-                        type=claim_type,
-                        confidence=claim_confidence,
-                        position={"start": text.find(sentence), "end": text.find(sentence) + len(sentence)},
-                        keywords=keywords,
-                        related_evidence=related_evidence
-                    )
-                    
-                    claims.append(claim)
+            # Score all sentences in one batched classifier call off the event loop
+            confidences = await self._classify_claims(sentences)
+            
+            # Encode the document's sentences once so every claim's evidence
+            # lookup reuses the same normalized embedding matrix
+            sentence_embeddings = None
+            if extract_evidence and confidences and max(confidences) >= confidence_threshold:
+                sentence_embeddings = await self._encode_texts(sentences)
+            
+            # Build claims for sentences above the threshold concurrently
+            claims = await asyncio.gather(*(
+                self._build_claim(
+                    text, sentence, claim_confidence, sentences, extract_evidence, sentence_embeddings
+                )
+                for sentence, claim_confidence in zip(sentences, confidences)
+                if claim_confidence >= confidence_threshold
+            ))
             
             processing_time = asyncio.get_event_loop().time() - start_time
             
             return ClaimExtractionResponse(
-                claims=claims,
+                claims=list(claims),
                 processing_time=processing_time,
                 model_version="claim-extractor-v1.0",
                 metadata={
@@ -127,24 +138,96 @@ class ClaimExtractor:
             logger.error(f"Claim extraction failed: {e}")
             raise
     
+    async def _build_claim(
+        self,
+        text: str,
+        sentence: str,
+        claim_confidence: float,
+        sentences: List[str],
+        extract_evidence: bool,
+        sentence_embeddings: Optional[np.ndarray] = None
+    ) -> ExtractedClaim:
+        """Build an extracted claim with its type, keywords and related evidence"""
+        # Find related evidence if requested
+        evidence_task = (
+            self._find_related_evidence(sentence, sentences, sentence_embeddings)
+            if extract_evidence else asyncio.sleep(0, result=[])
+        )
+        
+        # Determine claim type, extract keywords and find evidence together
+        claim_type, keywords, related_evidence = await asyncio.gather(
+            self._classify_claim_type(sentence),
+            self._extract_keywords(sentence),
+            evidence_task
+        )
+        
+        start = text.find(sentence)
+        return ExtractedClaim(
+            text=sentence,
+            type=claim_type,
+            confidence=claim_confidence,
+            position={"start": start, "end": start + len(sentence)},
+            keywords=keywords,
+            related_evidence=related_evidence
+        )
+    
     async def _classify_claim(self, sentence: str) -> float:
         """Classify if sentence contains a claim"""
+        return (await self._classify_claims([sentence]))[0]
+    
+    async def _classify_claims(self, sentences: List[str]) -> List[float]:
+        """Classify whether each sentence contains a claim, batched in one worker thread"""
+        if not sentences:
+            return []
+        
         try:
-            # Use MNLI model to classify if sentence is a claim
+            # Use MNLI model to classify if sentence is a claim; the
+            # "entailment" confidence indicates a claim
             hypothesis = "This sentence makes a factual claim or assertion."
             
-            result = self.claim_classifier(f"{sentence} [SEP] {hypothesis}")
-            
-            # Return confidence for "entailment" (indicates claim)
-            for item in result[0]:
-                if item['label'] == 'ENTAILMENT':
-                    return item['score']
-            
-            return 0.0
+            return await asyncio.to_thread(
+                self._entailment_scores,
+                [f"{sentence} [SEP] {hypothesis}" for sentence in sentences]
+            )
             
         except Exception as e:
             logger.error(f"Claim classification failed: {e}")
-            return 0.0
+            return [0.0] * len(sentences)
+    
+    def _entailment_scores(self, inputs: List[str]) -> List[float]:
+        """Run the claim classifier over inputs in length-sorted micro-batches and return entailment scores in input order"""
+        # Sort by character length (a cheap proxy for token count) so padding
+        # stays close to each micro-batch's own longest input
+        order = sorted(range(len(inputs)), key=lambda index: len(inputs[index]))
+        scores = [0.0] * len(inputs)
+        
+        for batch_start in range(0, len(order), self.inference_batch_size):
+            batch_indices = order[batch_start:batch_start + self.inference_batch_size]
+            results = self._run_claim_classifier([inputs[index] for index in batch_indices])
+            
+            for index, result in zip(batch_indices, results):
+                scores[index] = max(
+                    [item['score'] for item in result if item['label'] == 'ENTAILMENT'], default=0.0
+                )
+        
+        return scores
+    
+    def _run_claim_classifier(self, inputs: List[str]):
+        """Run the claim classifier on this thread's CUDA stream when on GPU"""
+        if self._device < 0:
+            return self.claim_classifier(inputs, batch_size=len(inputs))
+        
+        # Each worker thread gets its own stream, so one call's tokenization
+        # and host-to-device copies overlap another call's forward pass
+        stream = getattr(self._stream_local, "stream", None)
+        if stream is None:
+            stream = self._stream_local.stream = torch.cuda.Stream()
+        
+        with torch.cuda.stream(stream):
+            result = self.claim_classifier(inputs, batch_size=len(inputs))
+        stream.synchronize()
+        
+        return result
     
     async def _classify_claim_type(self, claim_text: str) -> ClaimType:
         """Classify the type of claim"""
@@ -152,12 +235,13 @@ class ClaimExtractor:
             # Simple heuristic-based classification
             # In production, this would use a trained model
             
-            lower_text = claim_text.lower()
+            # Match whole words so e.g. "show" no longer counts as "how"
+            words = set(self.word_pattern.findall(claim_text.lower()))
             
-            if any(word in lower_text for word in ['?', 'what', 'how', 'why', 'when', 'where']):
+            if '?' in claim_text or not words.isdisjoint(self.question_words):
                 return ClaimType.QUESTION
             
-            if any(word in lower_text for word in ['hypothesis', 'theory', 'propose', 'suggest', 'might', 'could', 'may']):
+            if not words.isdisjoint(self.hypothesis_words):
                 return ClaimType.HYPOTHESIS
             
             return ClaimType.ASSERTION
@@ -169,7 +253,8 @@ class ClaimExtractor:
     async def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text"""
         try:
-            doc = self.nlp(text)
+            # POS tags and lemmas are needed here, sentence boundaries are not
+            doc = await asyncio.to_thread(self.nlp, text, disable=["senter"])
             
             keywords = []
             for token in doc:
@@ -185,14 +270,19 @@ class ClaimExtractor:
             logger.error(f"Keyword extraction failed: {e}")
             return []
     
-    async def _find_related_evidence(self, claim: str, sentences: List[str]) -> List[str]:
+    async def _find_related_evidence(
+        self,
+        claim: str,
+        sentences: List[str],
+        sentence_embeddings: Optional[np.ndarray] = None
+    ) -> List[str]:
         """Find sentences that could serve as evidence for the claim"""
         try:
             if not self.similarity_model:
                 return []
             
             # Compute similarities
-            similarities = await self.compute_similarities(claim, sentences)
+            similarities = await self.compute_similarities(claim, sentences, sentence_embeddings)
             
             # Return top 3 most similar sentences (excluding the claim itself)
             evidence = []
@@ -206,21 +296,49 @@ class ClaimExtractor:
             logger.error(f"Evidence finding failed: {e}")
             return []
     
-    async def compute_similarities(self, query: str, texts: List[str]) -> List[float]:
+    async def _encode_texts(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Encode texts into L2-normalized embeddings"""
+        try:
+            if not self.similarity_model or not texts:
+                return None
+            
+            return await asyncio.to_thread(
+                self.similarity_model.encode,
+                texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+            )
+            
+        except Exception as e:
+            logger.error(f"Text encoding failed: {e}")
+            return None
+    
+    async def compute_similarities(
+        self,
+        query: str,
+        texts: List[str],
+        text_embeddings: Optional[np.ndarray] = None
+    ) -> List[float]:
         """Compute semantic similarities between query and texts"""
         try:
             if not self.similarity_model:
                 return [0.0] * len(texts)
             
-            # Encode query and texts
-            query_embedding = self.similarity_model.encode([query])
-            text_embeddings = self.similarity_model.encode(texts)
+            # Encode query and texts; normalized embeddings make the dot
+            # product a true cosine similarity
+            query_embedding = (await asyncio.to_thread(
+                self.similarity_model.encode,
+                [query], convert_to_numpy=True, normalize_embeddings=True
+            ))[0]
+            if text_embeddings is None:
+                text_embeddings = await asyncio.to_thread(
+                    self.similarity_model.encode,
+                    texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+                )
             
-            # Compute cosine similarities
-            similarities = np.dot(query_embedding, text_embeddings.T)[0]
+            # Compute cosine similarities with a single matrix-vector product
+            similarities = text_embeddings @ query_embedding
             
             return similarities.tolist()
             
         except Exception as e:
             logger.error(f"Similarity computation failed: {e}")
-            return [0.0] * len(texts)
\ No newline at end of file
+            return [0.0] * len(texts)
@@ -3,24 +3,98 @@ Graph analysis service for knowledge graph structure and relationships
 """
 
 import asyncio
+import hashlib
+import importlib.util
+import json
+import multiprocessing
+import os
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional, Tuple, Set
 import networkx as nx
 import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import shortest_path
 from sklearn.cluster import SpectralClustering, DBSCAN
 from sklearn.metrics.pairwise import cosine_similarity
 import community as community_louvain
 from loguru import logger
 import math
+from itertools import islice, takewhile
+from heapq import nlargest
 
 from models.schemas import GraphNode, GraphLink, AnalysisType, NodeAnalysis, ClusterInfo, PathInfo
 
+# GPU acceleration through the nx-cugraph NetworkX backend is optional
+try:
+    import nx_cugraph as nxcg
+except ImportError:
+    nxcg = None
+
+# Leiden community detection in C via igraph is optional
+try:
+    import igraph as ig
+    import leidenalg
+except ImportError:
+    leidenalg = None
+
+# NetworKit's multithreaded C++ kernels are an optional CPU fast path
+try:
+    import networkit as nk
+except ImportError:
+    nk = None
+
 
 class GraphAnalyzer:
     """Service for analyzing knowledge graph structure and relationships"""
     
-    def __init__(self):
+    def __init__(self, use_process_pool: bool = True):
         self.graph_cache = {}
-        self.analysis_cache = {}
+        
+        # Analysis results keyed by (graph fingerprint, analysis type,
+        # parameters), evicted least recently used
+        self.analysis_cache = OrderedDict()
+        self.analysis_cache_size = 128
+        
+        # Worker processes for the CPU-bound analyses; most NetworkX and
+        # Louvain code is pure Python and holds the GIL, so threads would
+        # not overlap. Spawned workers avoid forking a process with threads.
+        # The pool starts on first use, and only graphs with at least
+        # process_pool_min_size nodes plus edges are worth pickling to a
+        # worker; analyzers inside the workers run without a pool.
+        self.use_process_pool = use_process_pool
+        self.max_workers = int(os.getenv("GRAPH_ANALYSIS_PROCESSES", "4"))
+        self.process_pool_min_size = 5000
+        self._executor: Optional[ProcessPoolExecutor] = None
+        
+        # Sparse eigensolver for spectral clustering
+        self.spectral_eigen_solver = 'amg' if importlib.util.find_spec('pyamg') else 'arpack'
+        
+        # Without NetworKit, betweenness on graphs at least this large is
+        # split by source node across the worker processes
+        self.parallel_betweenness_min_nodes = 1000
+        
+        # Exact node connectivity runs a max-flow per node pair candidate, so
+        # it is skipped on larger graphs unless explicitly requested
+        self.node_connectivity_max_nodes = 500
+        
+        # Source rows per batch when computing all-pairs hop distances
+        self.distance_batch_size = 256
+        
+        # NetworkX algorithms run on the nx-cugraph GPU backend when installed
+        self.use_gpu_backend = nxcg is not None
+        
+        # NetworKit replacements for NetworkX algorithms whose results it
+        # reproduces exactly (unweighted shortest-path centralities)
+        self.networkit_algorithms = {}
+        if nk is not None:
+            nk.setNumberOfThreads(os.cpu_count() or 1)
+            self.networkit_algorithms = {
+                nx.betweenness_centrality: lambda g: nk.centrality.Betweenness(g, normalized=True),
+                nx.closeness_centrality: lambda g: nk.centrality.Closeness(
+                    g, True, nk.centrality.ClosenessVariant.GENERALIZED
+                )
+            }
         
         # Analysis algorithms
         self.centrality_algorithms = {
@@ -52,18 +126,19 @@ class GraphAnalyzer:
         try:
             # Build networkx graph
             G = await self._build_networkx_graph(nodes, links)
+            fingerprint = self._graph_fingerprint(nodes, links)
             
-            # Perform requested analysis
-            if analysis_type == AnalysisType.CENTRALITY:
-                result = await self._analyze_centrality(G, nodes, parameters or {})
-            elif analysis_type == AnalysisType.CLUSTERING:
-                result = await self._analyze_clustering(G, nodes, parameters or {})
-            elif analysis_type == AnalysisType.PATHFINDING:
-                result = await self._analyze_paths(G, nodes, parameters or {})
-            elif analysis_type == AnalysisType.INFLUENCE:
-                result = await self._analyze_influence(G, nodes, parameters or {})
+            # Convert the graph for the GPU backend once per request; graphs
+            # analyzed in worker processes are converted there instead
+            backend_graph = None if self._use_worker(G) else self._to_backend_graph(G)
+            
+            # Perform requested analysis, reusing cached results for the same graph
+            if analysis_type in self._analysis_methods():
+                result = await self._run_analysis(
+                    G, nodes, fingerprint, analysis_type, parameters or {}, backend_graph
+                )
             else:
-                result = await self._comprehensive_analysis(G, nodes)
+                result = await self._comprehensive_analysis(G, nodes, fingerprint, backend_graph)
             
             processing_time = asyncio.get_event_loop().time() - start_time
             
@@ -85,30 +160,117 @@ class GraphAnalyzer:
             logger.error(f"Graph analysis failed: {e}")
             raise
     
+    def _analysis_methods(self) -> Dict:
+        """Map each analysis type to the method computing it"""
+        return {
+            AnalysisType.CENTRALITY: self._analyze_centrality,
+            AnalysisType.CLUSTERING: self._analyze_clustering,
+            AnalysisType.PATHFINDING: self._analyze_paths,
+            AnalysisType.INFLUENCE: self._analyze_influence
+        }
+    
+    def _graph_fingerprint(self, nodes: List[GraphNode], links: List[GraphLink]) -> str:
+        """Hash the node and link fields that analysis results depend on"""
+        # Order is kept since it decides tie-breaking in the results.
+        # Properties become graph attributes and may override e.g. the
+        # weight, so they are hashed too.
+        digest = hashlib.blake2b(digest_size=16)
+        for node in nodes:
+            properties = json.dumps(node.properties, sort_keys=True, default=str)
+            digest.update(repr((node.id, node.type, node.label, properties)).encode())
+        digest.update(b"|")
+        for link in links:
+            properties = json.dumps(link.properties, sort_keys=True, default=str)
+            digest.update(repr((link.source, link.target, link.weight, link.type, properties)).encode())
+        
+        return digest.hexdigest()
+    
+    async def _run_analysis(
+        self,
+        G: nx.Graph,
+        nodes: List[GraphNode],
+        fingerprint: str,
+        analysis_type: AnalysisType,
+        parameters: Dict,
+        backend_graph=None
+    ) -> Dict:
+        """Run one analysis type, memoized on the graph fingerprint and parameters"""
+        cache_key = (fingerprint, analysis_type, json.dumps(parameters, sort_keys=True, default=str))
+        
+        if cache_key in self.analysis_cache:
+            self.analysis_cache.move_to_end(cache_key)
+        else:
+            result = None
+            if self._use_worker(G):
+                try:
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(
+                        self._get_executor(), _run_analysis_worker, analysis_type, G, nodes, parameters
+                    )
+                except Exception as e:
+                    logger.error(f"Analysis worker failed, running in process: {e}")
+            
+            if result is None:
+                try:
+                    result = await self._analysis_methods()[analysis_type](G, nodes, parameters, backend_graph)
+                except Exception:
+                    # Failures are not cached, so a transient error (GPU out of
+                    # memory, a Leiden failure) is retried on the next request
+                    return self._empty_result(analysis_type)
+            
+            self.analysis_cache[cache_key] = result
+            if len(self.analysis_cache) > self.analysis_cache_size:
+                self.analysis_cache.popitem(last=False)
+        
+        # Callers add request metadata to the top level, so hand out a copy
+        return dict(self.analysis_cache[cache_key])
+    
+    def _empty_result(self, analysis_type: AnalysisType) -> Dict:
+        """Result returned when an analysis fails"""
+        result = {"analysis_type": analysis_type, "global_metrics": {}}
+        if analysis_type == AnalysisType.PATHFINDING:
+            result["paths"] = []
+        else:
+            result["node_analyses"] = []
+        if analysis_type == AnalysisType.CLUSTERING:
+            result["clusters"] = []
+        
+        return result
+    
+    def _use_worker(self, G: nx.Graph) -> bool:
+        """Whether an analysis of G is large enough to run in a worker process"""
+        return (
+            self.use_process_pool
+            and G.number_of_nodes() + G.number_of_edges() >= self.process_pool_min_size
+        )
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the worker process pool, starting it on first use"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+    
     async def _build_networkx_graph(self, nodes: List[GraphNode], links: List[GraphLink]) -> nx.Graph:
         """Build NetworkX graph from nodes and links"""
         try:
             G = nx.Graph()
             
             # Add nodes
-            for node in nodes:
-                G.add_node(
-                    node.id,
-                    type=node.type,
-                    label=node.label,
-                    **node.properties
-                )
+            G.add_nodes_from(
+                (node.id, {"type": node.type, "label": node.label, **node.properties})
+                for node in nodes
+            )
             
-            # Add edges
-            for link in links:
-                if G.has_node(link.source) and G.has_node(link.target):
-                    G.add_edge(
-                        link.source,
-                        link.target,
-                        weight=link.weight,
-                        type=link.type,
-                        **link.properties
-                    )
+            # Add edges between known nodes
+            node_ids = {node.id for node in nodes}
+            G.add_edges_from(
+                (link.source, link.target, {"weight": link.weight, "type": link.type, **link.properties})
+                for link in links
+                if link.source in node_ids and link.target in node_ids
+            )
             
             return G
             
@@ -116,7 +278,9 @@ class GraphAnalyzer:
             logger.error(f"Graph building failed: {e}")
             return nx.Graph()
     
-    async def _analyze_centrality(self, G: nx.Graph, nodes: List[GraphNode], parameters: Dict) -> Dict:
+    async def _analyze_centrality(
+        self, G: nx.Graph, nodes: List[GraphNode], parameters: Dict, backend_graph=None
+    ) -> Dict:
         """Analyze node centrality measures"""
         try:
             algorithm = parameters.get('algorithm', 'pagerank')
@@ -135,48 +299,51 @@ class GraphAnalyzer:
                 # Handle algorithms that might fail
                 try:
                     if algorithm == 'eigenvector':
-                        centrality_scores = centrality_func(G, max_iter=1000)
+                        centrality_scores = self._run_algorithm(centrality_func, G, backend_graph, max_iter=1000)
                     elif algorithm == 'katz':
-                        centrality_scores = centrality_func(G, max_iter=1000)
+                        centrality_scores = self._run_algorithm(centrality_func, G, backend_graph, max_iter=1000)
                     else:
-                        centrality_scores = centrality_func(G)
+                        centrality_scores = self._run_algorithm(centrality_func, G, backend_graph)
                 except:
                     # Fallback to degree centrality
                     centrality_scores = nx.degree_centrality(G)
                     algorithm = 'degree'
             else:
-                centrality_scores = nx.pagerank(G)
+                centrality_scores = self._run_algorithm(nx.pagerank, G, backend_graph)
                 algorithm = 'pagerank'
             
-            # Create node analyses
-            node_analyses = []
-            for node in nodes:
-                if node.id in centrality_scores:
-                    analysis = NodeAnalysis(
-                        node_id=node.id,
-                        centrality_score=centrality_scores[node.id],
-                        properties={
-                            "algorithm": algorithm,
-                            "rank": 0,  # Will be set below
-                            "node_type": node.type,
-                            "node_label": node.label
-                        }
-                    )
-                    node_analyses.append(analysis)
-            
-            # Sort by centrality and assign ranks
-            node_analyses.sort(key=lambda x: x.centrality_score, reverse=True)
-            for i, analysis in enumerate(node_analyses):
-                analysis.properties["rank"] = i + 1
+            # Create node analyses already sorted by centrality, ranking at
+            # construction; the stable argsort keeps input order among ties
+            scored_nodes = [node for node in nodes if node.id in centrality_scores]
+            scores = np.array([centrality_scores[node.id] for node in scored_nodes], dtype=np.float64)
+            order = np.argsort(-scores, kind='stable')
+            node_analyses = [
+                NodeAnalysis.model_construct(
+                    node_id=(node := scored_nodes[i]).id,
+                    centrality_score=score,
+                    cluster_id=None,
+                    influence_score=None,
+                    properties={
+                        "algorithm": algorithm,
+                        "rank": rank,
+                        "node_type": node.type,
+                        "node_label": node.label
+                    }
+                )
+                for rank, (i, score) in enumerate(zip(order.tolist(), scores[order].tolist()), start=1)
+            ]
             
-            # Global metrics
-            centrality_values = list(centrality_scores.values())
+            # Global metrics, reduced over one array of the scores
+            centrality_values = np.fromiter(
+                centrality_scores.values(), dtype=np.float64, count=len(centrality_scores)
+            )
+            has_values = centrality_values.size > 0
             global_metrics = {
                 "centralization": self._calculate_centralization(centrality_values),
-                "max_centrality": max(centrality_values) if centrality_values else 0,
-                "min_centrality": min(centrality_values) if centrality_values else 0,
-                "mean_centrality": np.mean(centrality_values) if centrality_values else 0,
-                "std_centrality": np.std(centrality_values) if centrality_values else 0
+                "max_centrality": float(centrality_values.max()) if has_values else 0,
+                "min_centrality": float(centrality_values.min()) if has_values else 0,
+                "mean_centrality": centrality_values.mean() if has_values else 0,
+                "std_centrality": centrality_values.std() if has_values else 0
             }
             
             return {
@@ -187,13 +354,11 @@ class GraphAnalyzer:
             
         except Exception as e:
             logger.error(f"Centrality analysis failed: {e}")
-            return {
-                "analysis_type": AnalysisType.CENTRALITY,
-                "node_analyses": [],
-                "global_metrics": {}
-            }
+            raise
     
-    async def _analyze_clustering(self, G: nx.Graph, nodes: List[GraphNode], parameters: Dict) -> Dict:
+    async def _analyze_clustering(
+        self, G: nx.Graph, nodes: List[GraphNode], parameters: Dict, backend_graph=None
+    ) -> Dict:
         """Analyze graph clustering structure"""
         try:
             algorithm = parameters.get('algorithm', 'louvain')
@@ -212,27 +377,30 @@ class GraphAnalyzer:
             else:
                 clusters, cluster_assignments = await self._louvain_clustering(G, parameters)
             
-            # Create node analyses with cluster assignments
-            node_analyses = []
-            for node in nodes:
-                if node.id in cluster_assignments:
-                    analysis = NodeAnalysis(
-                        node_id=node.id,
-                        cluster_id=cluster_assignments[node.id],
-                        properties={
-                            "algorithm": algorithm,
-                            "node_type": node.type,
-                            "node_label": node.label
-                        }
-                    )
-                    node_analyses.append(analysis)
+            # Create node analyses with cluster assignments. The fields are
+            # already well-typed, so validation is skipped with model_construct.
+            node_analyses = [
+                NodeAnalysis.model_construct(
+                    node_id=node.id,
+                    centrality_score=None,
+                    cluster_id=int(cluster_id),
+                    influence_score=None,
+                    properties={
+                        "algorithm": algorithm,
+                        "node_type": node.type,
+                        "node_label": node.label
+                    }
+                )
+                for node in nodes
+                if (cluster_id := cluster_assignments.get(node.id)) is not None
+            ]
             
             # Calculate global clustering metrics
             global_metrics = {
                 "modularity": self._calculate_modularity(G, cluster_assignments),
                 "num_clusters": len(clusters),
                 "avg_cluster_size": np.mean([cluster.size for cluster in clusters]) if clusters else 0,
-                "clustering_coefficient": nx.average_clustering(G) if G.number_of_nodes() > 2 else 0
+                "clustering_coefficient": self._run_algorithm(nx.average_clustering, G, backend_graph) if G.number_of_nodes() > 2 else 0
             }
             
             return {
@@ -244,14 +412,11 @@ class GraphAnalyzer:
             
         except Exception as e:
             logger.error(f"Clustering analysis failed: {e}")
-            return {
-                "analysis_type": AnalysisType.CLUSTERING,
-                "node_analyses": [],
-                "clusters": [],
-                "global_metrics": {}
-            }
+            raise
     
-    async def _analyze_paths(self, G: nx.Graph, nodes: List[GraphNode], parameters: Dict) -> Dict:
+    async def _analyze_paths(
+        self, G: nx.Graph, nodes: List[GraphNode], parameters: Dict, backend_graph=None
+    ) -> Dict:
         """Analyze paths and connectivity in the graph"""
         try:
             source_node = parameters.get('source')
@@ -262,10 +427,16 @@ class GraphAnalyzer:
             
             if source_node and target_node:
                 # Find paths between specific nodes
-                if G.has_node(source_node) and G.has_node(target_node):
+                if G.has_node(source_node) and G.has_node(target_node) and source_node != target_node:
                     try:
-                        all_paths = list(nx.all_simple_paths(G, source_node, target_node, cutoff=5))
-                        for path in all_paths[:max_paths]:
+                        # Enumerate simple paths shortest first and stop after
+                        # max_paths, instead of materializing every path of up
+                        # to 5 edges
+                        shortest_paths = takewhile(
+                            lambda path: len(path) - 1 <= 5,
+                            nx.shortest_simple_paths(G, source_node, target_node)
+                        )
+                        for path in islice(shortest_paths, max_paths):
                             path_info = PathInfo(
                                 source=source_node,
                                 target=target_node,
@@ -278,20 +449,32 @@ class GraphAnalyzer:
                         pass
             else:
                 # Find important paths in the graph
-                paths = await self._find_important_paths(G, max_paths)
+                paths = await self._find_important_paths(G, max_paths, backend_graph)
+            
+            # Calculate path-related metrics; connectivity is -1 (unknown)
+            # on large graphs unless expensive metrics are requested
+            num_nodes = G.number_of_nodes()
+            if num_nodes <= 1:
+                connectivity = 0
+            elif (num_nodes < self.node_connectivity_max_nodes
+                  or parameters.get('compute_expensive_metrics', False)):
+                connectivity = nx.node_connectivity(G)
+            else:
+                connectivity = -1
             
-            # Calculate path-related metrics
             global_metrics = {
                 "average_shortest_path_length": 0,
                 "diameter": 0,
                 "radius": 0,
-                "connectivity": nx.node_connectivity(G) if G.number_of_nodes() > 1 else 0
+                "connectivity": connectivity
             }
             
-            if nx.is_connected(G) and G.number_of_nodes() > 1:
-                global_metrics["average_shortest_path_length"] = nx.average_shortest_path_length(G)
-                global_metrics["diameter"] = nx.diameter(G)
-                global_metrics["radius"] = nx.radius(G)
+            if num_nodes > 1 and nx.is_connected(G):
+                (
+                    global_metrics["average_shortest_path_length"],
+                    global_metrics["diameter"],
+                    global_metrics["radius"]
+                ) = self._distance_metrics(G)
             
             return {
                 "analysis_type": AnalysisType.PATHFINDING,
@@ -301,13 +484,31 @@ class GraphAnalyzer:
             
         except Exception as e:
             logger.error(f"Path analysis failed: {e}")
-            return {
-                "analysis_type": AnalysisType.PATHFINDING,
-                "paths": [],
-                "global_metrics": {}
-            }
+            raise
     
-    async def _analyze_influence(self, G: nx.Graph, nodes: List[GraphNode], parameters: Dict) -> Dict:
+    def _distance_metrics(self, G: nx.Graph) -> Tuple[float, int, int]:
+        """Average shortest path length, diameter and radius of a connected graph from one all-pairs pass"""
+        n = G.number_of_nodes()
+        A = nx.to_scipy_sparse_array(G, weight=None, format='csr')
+        
+        # Hop distances in batches of source rows keep memory at O(batch * n)
+        eccentricities = np.empty(n)
+        total_length = 0.0
+        for start in range(0, n, self.distance_batch_size):
+            indices = np.arange(start, min(start + self.distance_batch_size, n))
+            distances = shortest_path(A, directed=False, unweighted=True, indices=indices)
+            eccentricities[indices] = distances.max(axis=1)
+            total_length += distances.sum()
+        
+        return (
+            total_length / (n * (n - 1)),
+            int(eccentricities.max()),
+            int(eccentricities.min())
+        )
+    
+    async def _analyze_influence(
+        self, G: nx.Graph, nodes: List[GraphNode], parameters: Dict, backend_graph=None
+    ) -> Dict:
         """Analyze influence propagation in the graph"""
         try:
             source_nodes = parameters.get('source_nodes', [])
@@ -321,35 +522,41 @@ class GraphAnalyzer:
             
             # Calculate influence scores
             influence_scores = await self._calculate_influence_scores(
-                G, source_nodes, influence_model
+                G, source_nodes, influence_model, backend_graph
             )
             
-            # Create node analyses with influence scores
-            node_analyses = []
-            for node in nodes:
-                if node.id in influence_scores:
-                    analysis = NodeAnalysis(
-                        node_id=node.id,
-                        influence_score=influence_scores[node.id],
-                        properties={
-                            "model": influence_model,
-                            "is_source": node.id in source_nodes,
-                            "node_type": node.type,
-                            "node_label": node.label
-                        }
-                    )
-                    node_analyses.append(analysis)
-            
-            # Sort by influence score
-            node_analyses.sort(key=lambda x: x.influence_score or 0, reverse=True)
+            # Create node analyses already sorted by influence score
+            scored_nodes = [node for node in nodes if node.id in influence_scores]
+            scores = np.array(
+                [influence_scores[node.id] or 0 for node in scored_nodes], dtype=np.float64
+            )
+            order = np.argsort(-scores, kind='stable')
+            node_analyses = [
+                NodeAnalysis.model_construct(
+                    node_id=(node := scored_nodes[i]).id,
+                    centrality_score=None,
+                    cluster_id=None,
+                    influence_score=influence_scores[node.id],
+                    properties={
+                        "model": influence_model,
+                        "is_source": node.id in source_nodes,
+                        "node_type": node.type,
+                        "node_label": node.label
+                    }
+                )
+                for i in order.tolist()
+            ]
             
-            # Global influence metrics
-            influence_values = [score for score in influence_scores.values() if score is not None]
+            # Global influence metrics, reduced over one array of the scores
+            influence_values = np.array(
+                [score for score in influence_scores.values() if score is not None], dtype=np.float64
+            )
+            has_values = influence_values.size > 0
             global_metrics = {
-                "total_influence": sum(influence_values),
-                "max_influence": max(influence_values) if influence_values else 0,
-                "influence_spread": len([s for s in influence_values if s > 0.1]),
-                "influence_concentration": np.std(influence_values) if influence_values else 0
+                "total_influence": float(influence_values.sum()),
+                "max_influence": float(influence_values.max()) if has_values else 0,
+                "influence_spread": int(np.count_nonzero(influence_values > 0.1)),
+                "influence_concentration": influence_values.std() if has_values else 0
             }
             
             return {
@@ -360,20 +567,22 @@ class GraphAnalyzer:
             
         except Exception as e:
             logger.error(f"Influence analysis failed: {e}")
-            return {
-                "analysis_type": AnalysisType.INFLUENCE,
-                "node_analyses": [],
-                "global_metrics": {}
-            }
+            raise
     
-    async def _comprehensive_analysis(self, G: nx.Graph, nodes: List[GraphNode]) -> Dict:
+    async def _comprehensive_analysis(
+        self, G: nx.Graph, nodes: List[GraphNode], fingerprint: str, backend_graph=None
+    ) -> Dict:
         """Perform comprehensive graph analysis"""
         try:
-            # Run all analysis types
-            centrality_result = await self._analyze_centrality(G, nodes, {'algorithm': 'pagerank'})
-            clustering_result = await self._analyze_clustering(G, nodes, {'algorithm': 'louvain'})
-            path_result = await self._analyze_paths(G, nodes, {'max_paths': 5})
-            influence_result = await self._analyze_influence(G, nodes, {'model': 'linear_threshold'})
+            # Run all analysis types concurrently in worker processes; each
+            # sub-analysis is cached on its own so results from earlier
+            # single-type requests are reused
+            centrality_result, clustering_result, path_result, influence_result = await asyncio.gather(
+                self._run_analysis(G, nodes, fingerprint, AnalysisType.CENTRALITY, {'algorithm': 'pagerank'}, backend_graph),
+                self._run_analysis(G, nodes, fingerprint, AnalysisType.CLUSTERING, {'algorithm': 'louvain'}, backend_graph),
+                self._run_analysis(G, nodes, fingerprint, AnalysisType.PATHFINDING, {'max_paths': 5}, backend_graph),
+                self._run_analysis(G, nodes, fingerprint, AnalysisType.INFLUENCE, {'model': 'linear_threshold'}, backend_graph)
+            )
             
             # Combine results
             return {
@@ -386,7 +595,7 @@ class GraphAnalyzer:
                     "node_count": G.number_of_nodes(),
                     "edge_count": G.number_of_edges(),
                     "density": nx.density(G) if G.number_of_nodes() > 1 else 0,
-                    "transitivity": nx.transitivity(G),
+                    "transitivity": self._run_algorithm(nx.transitivity, G, backend_graph),
                     "assortativity": nx.degree_assortativity_coefficient(G) if G.number_of_edges() > 0 else 0
                 }
             }
@@ -401,52 +610,57 @@ class GraphAnalyzer:
     async def _louvain_clustering(self, G: nx.Graph, parameters: Dict) -> Tuple[List[ClusterInfo], Dict[str, int]]:
         """Perform Louvain community detection"""
         try:
-            partition = community_louvain.best_partition(G)
-            
-            # Group nodes by cluster
-            clusters_dict = {}
-            for node, cluster in partition.items():
-                if cluster not in clusters_dict:
-                    clusters_dict[cluster] = []
-                clusters_dict[cluster].append(node)
+            # Leiden refines Louvain's communities and runs in C; the
+            # pure-Python Louvain remains the fallback
+            if leidenalg is not None:
+                partition = self._leiden_partition(G)
+            else:
+                partition = community_louvain.best_partition(G)
             
             # Create cluster info objects
-            clusters = []
-            for cluster_id, cluster_nodes in clusters_dict.items():
-                # Calculate cluster coherence
-                subgraph = G.subgraph(cluster_nodes)
-                coherence = self._calculate_cluster_coherence(subgraph)
-                
-                # Find representative nodes (highest degree within cluster)
-                node_degrees = dict(subgraph.degree())
-                representative_nodes = sorted(node_degrees.keys(), 
-                                            key=node_degrees.get, reverse=True)[:3]
-                
-                cluster_info = ClusterInfo(
-                    cluster_id=cluster_id,
-                    size=len(cluster_nodes),
-                    coherence_score=coherence,
-                    representative_nodes=representative_nodes,
-                    description=f"Cluster {cluster_id} with {len(cluster_nodes)} nodes"
-                )
-                clusters.append(cluster_info)
+            clusters = self._build_cluster_infos(G, partition, "Cluster")
             
             return clusters, partition
             
         except Exception as e:
             logger.error(f"Louvain clustering failed: {e}")
-            return [], {}
+            raise
+    
+    def _leiden_partition(self, G: nx.Graph) -> Dict[str, int]:
+        """Partition G into modularity-optimal communities with the Leiden algorithm"""
+        node_list = list(G.nodes())
+        node_index = {node: i for i, node in enumerate(node_list)}
+        
+        edges = []
+        weights = []
+        for source, target, weight in G.edges(data='weight', default=1.0):
+            edges.append((node_index[source], node_index[target]))
+            weights.append(weight)
+        
+        ig_graph = ig.Graph(n=len(node_list), edges=edges)
+        leiden_partition = leidenalg.find_partition(
+            ig_graph, leidenalg.ModularityVertexPartition, weights=weights
+        )
+        
+        return dict(zip(node_list, leiden_partition.membership))
     
     async def _spectral_clustering(self, G: nx.Graph, parameters: Dict) -> Tuple[List[ClusterInfo], Dict[str, int]]:
         """Perform spectral clustering"""
         try:
             n_clusters = parameters.get('n_clusters', min(8, max(2, G.number_of_nodes() // 5)))
             
-            # Get adjacency matrix
+            # Get adjacency matrix (sparse CSR, kept sparse through the embedding)
             adjacency_matrix = nx.adjacency_matrix(G)
             
-            # Perform spectral clustering
-            clustering = SpectralClustering(n_clusters=n_clusters, affinity='precomputed')
+            # Perform spectral clustering. The multigrid solver (when pyamg is
+            # installed) only computes the few eigenvectors needed, and
+            # discretized labels avoid repeated k-means restarts.
+            clustering = SpectralClustering(
+                n_clusters=n_clusters,
+                affinity='precomputed',
+                eigen_solver=self.spectral_eigen_solver,
+                assign_labels='discretize'
+            )
             cluster_labels = clustering.fit_predict(adjacency_matrix)
             
             # Map node IDs to cluster labels
@@ -454,35 +668,13 @@ class GraphAnalyzer:
             partition = {nodes[i]: cluster_labels[i] for i in range(len(nodes))}
             
             # Create cluster info (similar to Louvain)
-            clusters_dict = {}
-            for node, cluster in partition.items():
-                if cluster not in clusters_dict:
-                    clusters_dict[cluster] = []
-                clusters_dict[cluster].append(node)
-            
-            clusters = []
-            for cluster_id, cluster_nodes in clusters_dict.items():
-                subgraph = G.subgraph(cluster_nodes)
-                coherence = self._calculate_cluster_coherence(subgraph)
-                
-                node_degrees = dict(subgraph.degree())
-                representative_nodes = sorted(node_degrees.keys(), 
-                                            key=node_degrees.get, reverse=True)[:3]
-                
-                cluster_info = ClusterInfo(
-                    cluster_id=int(cluster_id),
-                    size=len(cluster_nodes),
-                    coherence_score=coherence,
-                    representative_nodes=representative_nodes,
-                    description=f"Spectral cluster {cluster_id} with {len(cluster_nodes)} nodes"
-                )
-                clusters.append(cluster_info)
+            clusters = self._build_cluster_infos(G, partition, "Spectral cluster")
             
             return clusters, partition
             
         except Exception as e:
             logger.error(f"Spectral clustering failed: {e}")
-            return [], {}
+            raise
     
     async def _dbscan_clustering(self, G: nx.Graph, parameters: Dict) -> Tuple[List[ClusterInfo], Dict[str, int]]:
         """Perform DBSCAN clustering on graph"""
@@ -495,20 +687,14 @@ class GraphAnalyzer:
             if len(nodes) < min_samples:
                 return [], {}
             
-            # Create distance matrix
-            distance_matrix = np.zeros((len(nodes), len(nodes)))
-            for i, node1 in enumerate(nodes):
-                for j, node2 in enumerate(nodes):
-                    if i != j:
-                        try:
-                            path_length = nx.shortest_path_length(G, node1, node2)
-                            distance_matrix[i][j] = path_length
-                        except nx.NetworkXNoPath:
-                            distance_matrix[i][j] = float('inf')
+            # Create distance matrix with one BFS per node over the sparse
+            # adjacency matrix; unreachable pairs come back as inf
+            adjacency_matrix = nx.adjacency_matrix(G, nodelist=nodes, weight=None)
+            distance_matrix = shortest_path(adjacency_matrix, method='D', directed=False, unweighted=True)
             
             # Replace infinite distances with max finite distance + 1
-            max_finite = np.max(distance_matrix[distance_matrix != float('inf')])
-            distance_matrix[distance_matrix == float('inf')] = max_finite + 1
+            finite = np.isfinite(distance_matrix)
+            distance_matrix[~finite] = distance_matrix[finite].max() + 1
             
             # Perform DBSCAN
             clustering = DBSCAN(eps=eps, min_samples=min_samples, metric='precomputed')
@@ -517,45 +703,25 @@ class GraphAnalyzer:
             # Map node IDs to cluster labels
             partition = {nodes[i]: cluster_labels[i] for i in range(len(nodes))}
             
-            # Create cluster info
-            clusters_dict = {}
-            for node, cluster in partition.items():
-                if cluster != -1:  # Ignore noise points
-                    if cluster not in clusters_dict:
-                        clusters_dict[cluster] = []
-                    clusters_dict[cluster].append(node)
-            
-            clusters = []
-            for cluster_id, cluster_nodes in clusters_dict.items():
-                subgraph = G.subgraph(cluster_nodes)
-                coherence = self._calculate_cluster_coherence(subgraph)
-                
-                node_degrees = dict(subgraph.degree())
-                representative_nodes = sorted(node_degrees.keys(), 
-                                            key=node_degrees.get, reverse=True)[:3]
-                
-                cluster_info = ClusterInfo(
-                    cluster_id=int(cluster_id),
-                    size=len(cluster_nodes),
-                    coherence_score=coherence,
-                    representative_nodes=representative_nodes,
-                    description=f"DBSCAN cluster {cluster_id} with {len(cluster_nodes)} nodes"
-                )
-                clusters.append(cluster_info)
+            # Create cluster info, ignoring noise points
+            clusters = self._build_cluster_infos(G, partition, "DBSCAN cluster", noise_label=-1)
             
             return clusters, partition
             
         except Exception as e:
             logger.error(f"DBSCAN clustering failed: {e}")
-            return [], {}
+            raise
     
-    async def _find_important_paths(self, G: nx.Graph, max_paths: int) -> List[PathInfo]:
+    async def _find_important_paths(self, G: nx.Graph, max_paths: int, backend_graph=None) -> List[PathInfo]:
         """Find important paths in the graph"""
         try:
             paths = []
             
             # Get high centrality nodes as path endpoints
-            centrality = nx.betweenness_centrality(G)
+            if self._use_parallel_betweenness(G, backend_graph):
+                centrality = await self._parallel_betweenness(G)
+            else:
+                centrality = self._run_algorithm(nx.betweenness_centrality, G, backend_graph)
             important_nodes = sorted(centrality.keys(), key=centrality.get, reverse=True)[:10]
             
             # Find paths between important nodes
@@ -589,9 +755,11 @@ class GraphAnalyzer:
             
         except Exception as e:
             logger.error(f"Important path finding failed: {e}")
-            return []
+            raise
     
-    async def _calculate_influence_scores(self, G: nx.Graph, source_nodes: List[str], model: str) -> Dict[str, float]:
+    async def _calculate_influence_scores(
+        self, G: nx.Graph, source_nodes: List[str], model: str, backend_graph=None
+    ) -> Dict[str, float]:
         """Calculate influence propagation scores"""
         try:
             influence_scores = {}
@@ -599,61 +767,141 @@ class GraphAnalyzer:
             if model == 'linear_threshold':
                 # Simple linear threshold model
                 threshold = 0.5
-                influenced = set(source_nodes)
+                node_list = list(G.nodes())
+                if not node_list:
+                    return influence_scores
+                source_set = set(source_nodes)
+                
+                # Weighted and unweighted adjacency, so one sparse
+                # matrix-vector product per round sums the edge weights to
+                # (and counts) each node's influenced neighbors
+                weighted_adjacency = nx.adjacency_matrix(G, nodelist=node_list, weight='weight')
+                binary_adjacency = nx.adjacency_matrix(G, nodelist=node_list, weight=None)
                 
                 # Initialize influence scores
-                for node in G.nodes():
-                    if node in source_nodes:
-                        influence_scores[node] = 1.0
-                    else:
-                        influence_scores[node] = 0.0
+                influenced = np.array([node in source_set for node in node_list], dtype=np.float64)
+                scores = influenced.copy()
                 
                 # Iterative influence propagation
                 for iteration in range(5):  # Max 5 iterations
-                    new_influenced = set()
-                    
-                    for node in G.nodes():
-                        if node not in influenced:
-                            # Calculate influence from neighbors
-                            neighbor_influence = 0
-                            neighbor_count = 0
-                            
-                            for neighbor in G.neighbors(node):
-                                if neighbor in influenced:
-                                    edge_weight = G[node][neighbor].get('weight', 1.0)
-                                    neighbor_influence += edge_weight
-                                    neighbor_count += 1
-                            
-                            if neighbor_count > 0:
-                                avg_influence = neighbor_influence / neighbor_count
-                                if avg_influence >= threshold:
-                                    new_influenced.add(node)
-                                    influence_scores[node] = avg_influence
-                    
-                    influenced.update(new_influenced)
+                    neighbor_influence = weighted_adjacency @ influenced
+                    neighbor_count = binary_adjacency @ influenced
+                    avg_influence = np.divide(
+                        neighbor_influence, neighbor_count,
+                        out=np.zeros_like(neighbor_influence), where=neighbor_count > 0
+                    )
                     
-                    if not new_influenced:  # No new nodes influenced
+                    new_influenced = (influenced == 0) & (neighbor_count > 0) & (avg_influence >= threshold)
+                    if not new_influenced.any():  # No new nodes influenced
                         break
+                    
+                    scores[new_influenced] = avg_influence[new_influenced]
+                    influenced[new_influenced] = 1.0
+                
+                influence_scores = dict(zip(node_list, scores.tolist()))
             
             else:  # Default to PageRank-based influence
-                pagerank_scores = nx.pagerank(G, personalization={node: 1.0 for node in source_nodes})
+                pagerank_scores = self._run_algorithm(
+                    nx.pagerank, G, backend_graph, personalization={node: 1.0 for node in source_nodes}
+                )
                 influence_scores = pagerank_scores
             
             return influence_scores
             
         except Exception as e:
             logger.error(f"Influence calculation failed: {e}")
-            return {}
+            raise
     
-    def _calculate_centralization(self, centrality_values: List[float]) -> float:
+    def _to_backend_graph(self, G: nx.Graph):
+        """Convert G for the nx-cugraph GPU backend, or return None to run on CPU"""
+        if not self.use_gpu_backend or G.number_of_nodes() == 0:
+            return None
+        
+        try:
+            return nxcg.from_networkx(G, edge_attrs={"weight": 1.0})
+        except Exception as e:
+            logger.warning(f"GPU graph conversion failed, running on CPU: {e}")
+            return None
+    
+    def _run_algorithm(self, func, G: nx.Graph, backend_graph=None, **kwargs):
+        """Run a NetworkX algorithm on G's GPU backend graph when given, otherwise on CPU"""
+        if backend_graph is not None:
+            try:
+                return func(backend_graph, **kwargs)
+                
+            except (NotImplementedError, nx.NetworkXNotImplemented):
+                # Algorithm not provided by nx-cugraph; fall back to CPU
+                pass
+            except Exception as e:
+                logger.warning(f"GPU backend failed for {func.__name__}, running on CPU: {e}")
+        
+        # Parameterless shortest-path centralities run in NetworKit on CPU
+        if func in self.networkit_algorithms and not kwargs and G.number_of_nodes() > 2:
+            nk_graph, node_list = self._to_networkit(G)
+            scores = self.networkit_algorithms[func](nk_graph).run().scores()
+            return dict(zip(node_list, scores))
+        
+        return func(G, **kwargs)
+    
+    def _use_parallel_betweenness(self, G: nx.Graph, backend_graph=None) -> bool:
+        """Whether betweenness on G is split across the worker processes"""
+        # Only the parent process splits betweenness across the pool; inside
+        # a worker it runs serially rather than spawning nested processes.
+        # The GPU backend and NetworKit are faster when available.
+        return (
+            self.use_process_pool
+            and backend_graph is None
+            and nx.betweenness_centrality not in self.networkit_algorithms
+            and G.number_of_nodes() >= self.parallel_betweenness_min_nodes
+        )
+    
+    async def _parallel_betweenness(self, G: nx.Graph) -> Dict[str, float]:
+        """Normalized betweenness centrality summed from per-chunk source subsets"""
+        node_list = list(G)
+        chunk_size = math.ceil(len(node_list) / self.max_workers)
+        node_chunks = [node_list[i:i + chunk_size] for i in range(0, len(node_list), chunk_size)]
+        
+        # Workers get the bare edge list rather than the attributed graph,
+        # and the chunks are awaited so the event loop keeps serving requests
+        edges = list(G.edges())
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        partial_results = await asyncio.gather(*(
+            loop.run_in_executor(executor, _betweenness_chunk, node_list, edges, sources)
+            for sources in node_chunks
+        ))
+        
+        betweenness = dict.fromkeys(node_list, 0.0)
+        for partial_betweenness in partial_results:
+            for node, score in partial_betweenness.items():
+                betweenness[node] += score
+        
+        # Subsets give unnormalized undirected scores; rescale like NetworkX
+        n = len(node_list)
+        scale = 2 / ((n - 1) * (n - 2))
+        return {node: score * scale for node, score in betweenness.items()}
+    
+    def _to_networkit(self, G: nx.Graph):
+        """Convert G to an unweighted NetworKit graph, returning it with the node order used"""
+        node_list = list(G.nodes())
+        node_index = {node: i for i, node in enumerate(node_list)}
+        
+        nk_graph = nk.Graph(len(node_list))
+        for source, target in G.edges():
+            if source != target:  # Self-loops never lie on shortest paths
+                nk_graph.addEdge(node_index[source], node_index[target])
+        
+        return nk_graph, node_list
+    
+    def _calculate_centralization(self, centrality_values: np.ndarray) -> float:
         """Calculate graph centralization measure"""
         try:
-            if not centrality_values:
+            centrality_values = np.asarray(centrality_values, dtype=np.float64)
+            if centrality_values.size == 0:
                 return 0.0
             
-            max_centrality = max(centrality_values)
-            sum_differences = sum(max_centrality - c for c in centrality_values)
-            n = len(centrality_values)
+            n = centrality_values.size
+            sum_differences = float((centrality_values.max() - centrality_values).sum())
             
             # Theoretical maximum for a star graph
             max_possible = (n - 1) * (n - 2) / (n - 1) if n > 2 else 1
@@ -676,29 +924,100 @@ class GraphAnalyzer:
             logger.error(f"Modularity calculation failed: {e}")
             return 0.0
     
-    def _calculate_cluster_coherence(self, subgraph: nx.Graph) -> float:
-        """Calculate coherence score for a cluster"""
+    def _build_cluster_infos(
+        self,
+        G: nx.Graph,
+        partition: Dict[str, int],
+        label_prefix: str,
+        noise_label: Optional[int] = None
+    ) -> List[ClusterInfo]:
+        """Build cluster info objects for every cluster in a partition"""
+        # Group nodes by cluster
+        clusters_dict = defaultdict(list)
+        for node, cluster in partition.items():
+            clusters_dict[cluster].append(node)
+        clusters_dict.pop(noise_label, None)
+        
+        # Degrees within each node's own cluster from one pass over the
+        # edges, and every cluster's coherence from one adjacency sweep
+        intra_degrees = self._intra_cluster_degrees(G, partition)
+        coherences = self._calculate_cluster_coherences(G, partition)
+        
+        return [
+            ClusterInfo(
+                cluster_id=int(cluster_id),
+                size=len(cluster_nodes),
+                coherence_score=coherences.get(cluster_id, 0.0),
+                # Representative nodes have the highest degree within the cluster
+                representative_nodes=nlargest(3, cluster_nodes, key=intra_degrees.__getitem__),
+                description=f"{label_prefix} {cluster_id} with {len(cluster_nodes)} nodes"
+            )
+            for cluster_id, cluster_nodes in clusters_dict.items()
+        ]
+    
+    def _intra_cluster_degrees(self, G: nx.Graph, partition: Dict[str, int]) -> Dict[str, int]:
+        """Degree of each node counting only edges inside its own cluster"""
+        degrees = dict.fromkeys(G, 0)
+        for source, target in G.edges():
+            if partition.get(source) == partition.get(target):
+                # A self-loop adds two to its node's degree, as in NetworkX
+                degrees[source] += 1
+                degrees[target] += 1
+        
+        return degrees
+    
+    def _calculate_cluster_coherences(self, G: nx.Graph, partition: Dict[str, int]) -> Dict[int, float]:
+        """Calculate the coherence score of every cluster in a partition"""
         try:
-            if subgraph.number_of_nodes() <= 1:
-                return 1.0
-            
-            # Internal density
-            internal_edges = subgraph.number_of_edges()
-            possible_edges = subgraph.number_of_nodes() * (subgraph.number_of_nodes() - 1) / 2
+            if not partition:
+                return {}
             
-            density = internal_edges / possible_edges if possible_edges > 0 else 0
+            node_list = list(partition)
+            cluster_ids, labels = np.unique(
+                [partition[node] for node in node_list], return_inverse=True
+            )
+            sizes = np.bincount(labels, minlength=len(cluster_ids)).astype(np.float64)
+            
+            # Keep only edges whose endpoints share a cluster
+            A = nx.to_scipy_sparse_array(G, nodelist=node_list, weight=None, format='csr').tocoo()
+            intra = labels[A.row] == labels[A.col]
+            row, col = A.row[intra], A.col[intra]
+            
+            # Internal density; each undirected edge (self-loops included)
+            # is counted once from the upper triangle
+            upper = row <= col
+            internal_edges = np.bincount(labels[row[upper]], minlength=len(cluster_ids))
+            possible_edges = sizes * (sizes - 1) / 2
+            density = np.divide(
+                internal_edges, possible_edges,
+                out=np.zeros_like(sizes), where=possible_edges > 0
+            )
             
-            # Average clustering coefficient
-            clustering_coeff = nx.average_clustering(subgraph) if subgraph.number_of_nodes() > 2 else 0
+            # Local clustering within each cluster's subgraph (self-loops ignored)
+            off_diagonal = row != col
+            n = len(node_list)
+            B = coo_matrix(
+                (np.ones(off_diagonal.sum()), (row[off_diagonal], col[off_diagonal])),
+                shape=(n, n)
+            ).tocsr()
+            degrees = np.asarray(B.sum(axis=1)).ravel()
+            triangles = np.asarray((B @ B).multiply(B).sum(axis=1)).ravel() / 2
+            possible_triangles = degrees * (degrees - 1) / 2
+            local_clustering = np.divide(
+                triangles, possible_triangles,
+                out=np.zeros(n), where=possible_triangles > 0
+            )
+            clustering_coeff = np.bincount(labels, weights=local_clustering, minlength=len(cluster_ids)) / sizes
+            clustering_coeff[sizes <= 2] = 0.0
             
-            # Combine metrics
-            coherence = (density + clustering_coeff) / 2
+            # Combine metrics; singletons are trivially coherent
+            coherence = np.where(sizes <= 1, 1.0, (density + clustering_coeff) / 2)
             
-            return coherence
+            return dict(zip(cluster_ids.tolist(), coherence.tolist()))
             
         except Exception as e:
             logger.error(f"Cluster coherence calculation failed: {e}")
-            return 0.0
+            return {}
     
     def _calculate_path_strength(self, G: nx.Graph, path: List[str]) -> float:
         """Calculate the strength of a path based on edge weights"""
@@ -706,15 +1025,45 @@ class GraphAnalyzer:
             if len(path) < 2:
                 return 0.0
             
-            total_weight = 0.0
-            for i in range(len(path) - 1):
-                edge_data = G.get_edge_data(path[i], path[i + 1])
-                weight = edge_data.get('weight', 1.0) if edge_data else 1.0
-                total_weight += weight
+            # Walk consecutive node pairs directly; missing edges count as 1.0
+            total_weight = sum(
+                (G.get_edge_data(source, target) or {}).get('weight', 1.0)
+                for source, target in zip(path, path[1:])
+            )
             
             # Average weight along the path
             return total_weight / (len(path) - 1)
             
         except Exception as e:
             logger.error(f"Path strength calculation failed: {e}")
-            return 0.0
\ No newline at end of file
+            return 0.0
+
+
+def _betweenness_chunk(node_list: List[str], edges: List[Tuple[str, str]], sources: List[str]) -> Dict[str, float]:
+    """Unnormalized betweenness contribution of shortest paths from the given sources"""
+    G = nx.Graph()
+    G.add_nodes_from(node_list)
+    G.add_edges_from(edges)
+    return nx.betweenness_centrality_subset(G, sources, node_list, normalized=False)
+
+
+# Analyzer used inside each worker process, created on its first task
+_worker_analyzer: Optional[GraphAnalyzer] = None
+
+
+def _run_analysis_worker(
+    analysis_type: AnalysisType,
+    G: nx.Graph,
+    nodes: List[GraphNode],
+    parameters: Dict
+) -> Dict:
+    """Run one analysis type in a worker process"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        # Worker-side analyzers never start a nested pool of their own
+        _worker_analyzer = GraphAnalyzer(use_process_pool=False)
+    
+    # The unpickled graph is converted for the GPU backend once per task
+    method = _worker_analyzer._analysis_methods()[analysis_type]
+    backend_graph = _worker_analyzer._to_backend_graph(G)
+    return asyncio.run(method(G, nodes, parameters, backend_graph))
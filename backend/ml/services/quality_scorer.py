@@ -3,18 +3,218 @@ Quality assessment service for evaluating claim confidence and reliability
 """
 
 import asyncio
-from typing import List, Dict, Optional, Tuple
+import copy
+import os
+import threading
+from functools import lru_cache
+from typing import List, Dict, Optional, Sequence, Tuple
 import numpy as np
 import spacy
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from textblob import TextBlob
 import re
+import operator
 from loguru import logger
-from collections import Counter
+from collections import Counter, OrderedDict
 import math
 
 from models.schemas import ExtractedClaim, ClaimType
 
+# Aho-Corasick matching of the indicator phrase tables is optional
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Indicator phrases for the lexical assessments, matched as substrings of the
+# lowercased text; each phrase counts once however often it occurs
+PHRASE_TABLES = {
+    'high_confidence': (
+        'proven', 'demonstrated', 'established', 'confirmed', 'verified',
+        'conclusive', 'definitive', 'certain', 'undeniable', 'fact'
+    ),
+    'medium_confidence': (
+        'evidence suggests', 'indicates', 'shows', 'research shows',
+        'studies indicate', 'data suggests', 'findings show'
+    ),
+    'low_confidence': (
+        'might', 'could', 'may', 'possibly', 'perhaps', 'seems',
+        'appears', 'suggests', 'implies', 'potentially'
+    ),
+    'uncertainty': (
+        'unclear', 'uncertain', 'ambiguous', 'debatable', 'controversial',
+        'disputed', 'questionable', 'unconfirmed', 'alleged'
+    ),
+    'quantitative_terms': (
+        'percent', 'percentage', 'ratio', 'rate', 'correlation', 'significant',
+        'study', 'research', 'data', 'analysis', 'measurement', 'experiment'
+    ),
+    'vague_terms': (
+        'some', 'many', 'several', 'various', 'numerous', 'often', 'sometimes',
+        'generally', 'usually', 'mostly', 'largely', 'somewhat', 'quite'
+    ),
+    'source_indicators': (
+        'study', 'research', 'experiment', 'analysis', 'survey',
+        'journal', 'published', 'peer-reviewed', 'data', 'statistics'
+    ),
+    'strength_indicators': (
+        'significant', 'conclusive', 'demonstrated', 'proven', 'confirmed',
+        'correlation', 'p-value', 'confidence interval', 'effect size'
+    ),
+    'emotional_bias': (
+        'amazing', 'terrible', 'fantastic', 'awful', 'incredible', 'shocking',
+        'outrageous', 'brilliant', 'catastrophic', 'devastating'
+    ),
+    'absolute_bias': (
+        'always', 'never', 'all', 'none', 'every', 'no one', 'everyone',
+        'completely', 'totally', 'absolutely', 'perfectly'
+    ),
+    'loaded_bias': (
+        'obviously', 'clearly', 'undoubtedly', 'certainly', 'definitely',
+        'surely', 'of course', 'needless to say'
+    ),
+    'factual_indicators': (
+        'research shows', 'study found', 'data indicates', 'statistics show',
+        'according to', 'published in', 'peer-reviewed', 'empirical evidence',
+        'experimental results', 'clinical trial', 'meta-analysis'
+    ),
+    'opinion_indicators': (
+        'i think', 'i believe', 'in my opinion', 'personally', 'i feel',
+        'seems to me', 'i suspect', 'my view', 'i would argue'
+    ),
+    'conditions': ('if', 'when', 'unless', 'provided', 'assuming'),
+    'scope': ('some', 'most', 'many', 'few', 'certain'),
+    'logical_connectors': (
+        'because', 'therefore', 'thus', 'hence', 'consequently', 'as a result',
+        'since', 'due to', 'owing to', 'given that', 'considering that'
+    ),
+    'causal_language': (
+        'causes', 'leads to', 'results in', 'brings about', 'produces',
+        'triggers', 'influences', 'affects', 'impacts', 'contributes to'
+    ),
+    'evidence_phrases': (
+        'based on', 'according to', 'evidence shows', 'research indicates',
+        'studies demonstrate', 'data suggests', 'analysis reveals'
+    ),
+    'source_quality': (
+        'university', 'institute', 'journal', 'nature', 'science',
+        'academic', 'research', 'peer-reviewed', 'published'
+    )
+}
+
+
+def _load_spacy_model():
+    """Load spaCy for linguistic analysis"""
+    # Only POS tags, dependencies and entities are used, so lemmas are never computed
+    return spacy.load("en_core_web_sm", exclude=["lemmatizer"])
+
+
+def _load_sequence_classifier(model_name: str):
+    """Load a (tokenizer, model) classifier, in half precision on GPU and INT8 on CPU"""
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(
+        model_name,
+        torch_dtype=torch.float16 if device.type == "cuda" else torch.float32
+    ).to(device).eval()
+    
+    # The quality scores are coarse signals, so dynamic INT8 quantization of
+    # the linear layers is on by default for CPU inference
+    if device.type == "cpu" and os.getenv("QUALITY_SCORER_INT8", "1") != "0":
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    
+    return tokenizer, model
+
+
+def _load_sentiment_analyzer():
+    """Load the sentiment classifier"""
+    return _load_sequence_classifier("cardiffnlp/twitter-roberta-base-sentiment-latest")
+
+
+def _load_bias_detector():
+    """Load the bias detection classifier"""
+    return _load_sequence_classifier("martin-ha/toxic-comment-model")
+
+
+# Maps every byte to b'v' (ASCII vowel) or b'c' (anything else), so a word's
+# vowel runs become b'cv' transitions that bytes.count finds in C
+VOWEL_MASK_TABLE = bytes(ord('v') if chr(i) in 'aeiouy' else ord('c') for i in range(256))
+
+# Below this length the per-character loop beats encoding and translating
+SYLLABLE_MASK_MIN_LENGTH = 8
+
+
+@lru_cache(maxsize=65536)
+def _count_word_syllables(word: str) -> int:
+    """Count syllables in a lowercase word (approximation), memoized since tokens recur across claims"""
+    if not word:
+        return 0
+    
+    if len(word) >= SYLLABLE_MASK_MIN_LENGTH:
+        # Multi-byte UTF-8 sequences only contain non-ASCII bytes, which all
+        # map to consonants, so vowel runs are preserved
+        vowel_mask = word.encode('utf-8', 'surrogatepass').translate(VOWEL_MASK_TABLE)
+        syllable_count = (b'c' + vowel_mask).count(b'cv')
+    else:
+        vowels = 'aeiouy'
+        syllable_count = 0
+        prev_was_vowel = False
+        
+        for char in word:
+            if char in vowels:
+                if not prev_was_vowel:
+                    syllable_count += 1
+                prev_was_vowel = True
+            else:
+                prev_was_vowel = False
+    
+    # Handle silent e
+    if word.endswith('e'):
+        syllable_count -= 1
+    
+    return max(1, syllable_count)
+
+
+@lru_cache(maxsize=None)
+def _build_phrase_automaton():
+    """Build the Aho-Corasick automaton over PHRASE_TABLES once per process, or None without ahocorasick"""
+    if ahocorasick is None:
+        return None
+    
+    phrase_categories = {}
+    for category, phrases in PHRASE_TABLES.items():
+        for phrase in phrases:
+            phrase_categories.setdefault(phrase, []).append(category)
+    
+    automaton = ahocorasick.Automaton()
+    for phrase, categories in phrase_categories.items():
+        automaton.add_word(phrase, (phrase, tuple(categories)))
+    automaton.make_automaton()
+    
+    return automaton
+
+
+# Models are loaded on first use and shared by every QualityScorer; the lock
+# keeps concurrent first calls (e.g. from worker threads) from loading twice
+_shared_models: Dict = {}
+_shared_models_lock = threading.Lock()
+
+
+def _get_shared_model(loader):
+    """Return the model built by loader, loading it once per process"""
+    model = _shared_models.get(loader)
+    if model is None:
+        with _shared_models_lock:
+            model = _shared_models.get(loader)
+            if model is None:
+                logger.info(f"Loading quality scoring model ({loader.__name__})...")
+                model = _shared_models[loader] = loader()
+    
+    return model
+
 
 class QualityMetrics:
     """Container for quality assessment metrics"""
@@ -34,20 +234,258 @@ class QualityMetrics:
         self.linguistic_features = {}
         self.structural_features = {}
         self.semantic_features = {}
-        self.issues = []
-        self.recommendations = []
+        self.issues = ()
+        self.recommendations = ()
+    
+    def score_vector(self) -> List[float]:
+        """Dimension scores in the order of OVERALL_SCORE_WEIGHTS"""
+        return [
+            self.confidence_score, self.clarity_score, self.specificity_score,
+            self.evidence_score, self.bias_score, self.factuality_score,
+            self.completeness_score, self.reasoning_score, self.source_reliability
+        ]
+    
+    def issue_key(self) -> Tuple[float, ...]:
+        """Scores that issues and recommendations depend on, in ISSUE_SCORE_FIELDS order"""
+        return (
+            self.confidence_score, self.clarity_score, self.specificity_score,
+            self.evidence_score, self.bias_score, self.factuality_score,
+            self.completeness_score, self.reasoning_score
+        )
+
+
+# Punctuation counted by the structural features besides '?' and '!'
+SENTENCE_PUNCTUATION = '.,;:'
+
+# Dependency labels checked by the structural assessments
+COMPLEX_CLAUSE_DEPS = frozenset({'csubj', 'ccomp', 'advcl'})
+SUBJECT_DEPS = frozenset({'nsubj', 'nsubjpass'})
+OBJECT_DEPS = frozenset({'dobj', 'pobj'})
+
+
+class ParsedText:
+    """A text and its spaCy parse, with the lowercase form and counts shared by the assessors"""
+    __slots__ = (
+        'text', 'text_lower', 'doc', 'whitespace_word_count', 'word_count',
+        'number_count', 'alpha_tokens', 'entity_counts',
+        '_sentence_count', '_complex_sentence_count'
+    )
+    
+    def __init__(self, text: str, doc):
+        self.text = text
+        self.text_lower = text.lower()
+        self.doc = doc
+        self.whitespace_word_count = len(text.split())
+        
+        # One pass over the tokens for the counts most assessors need
+        word_count = 0
+        number_count = 0
+        alpha_tokens = []
+        for token in doc:
+            if not token.is_punct:
+                word_count += 1
+            if token.like_num:
+                number_count += 1
+            if token.is_alpha:
+                alpha_tokens.append(token)
+        
+        self.word_count = word_count
+        self.number_count = number_count
+        self.alpha_tokens = alpha_tokens
+        self.entity_counts = Counter(ent.label_ for ent in doc.ents)
+        
+        # Sentence counts are only needed for claims, not evidence pieces
+        self._sentence_count = None
+        self._complex_sentence_count = None
+    
+    def _count_sentences(self):
+        """Count sentences, and those with subordinate clauses, in one pass over doc.sents"""
+        sentence_count = 0
+        complex_sentence_count = 0
+        for sent in self.doc.sents:
+            sentence_count += 1
+            if any(token.dep_ in COMPLEX_CLAUSE_DEPS for token in sent):
+                complex_sentence_count += 1
+        
+        self._sentence_count = sentence_count
+        self._complex_sentence_count = complex_sentence_count
+    
+    @property
+    def sentence_count(self) -> int:
+        """Number of sentences in the parse"""
+        if self._sentence_count is None:
+            self._count_sentences()
+        return self._sentence_count
+    
+    @property
+    def complex_sentence_count(self) -> int:
+        """Number of sentences containing a subordinate clause"""
+        if self._complex_sentence_count is None:
+            self._count_sentences()
+        return self._complex_sentence_count
+
+
+# Overall quality weights, in QualityMetrics.score_vector order. Lower bias is
+# better, so bias enters as (1 - bias) * 0.10: a negated weight plus an offset.
+OVERALL_SCORE_WEIGHTS = np.array([0.15, 0.15, 0.12, 0.18, -0.10, 0.15, 0.08, 0.05, 0.02])
+OVERALL_SCORE_OFFSET = 0.10
+
+
+# Order of the scores in QualityMetrics.issue_key, which is also the order of
+# the first eight QualityMetrics.score_vector entries
+ISSUE_SCORE_FIELDS = (
+    'confidence_score', 'clarity_score', 'specificity_score', 'evidence_score',
+    'bias_score', 'factuality_score', 'completeness_score', 'reasoning_score'
+)
+
+
+class ScoreRules:
+    """Threshold rules over the QualityMetrics.issue_key scores, each with a message"""
+    __slots__ = ('rules', 'columns', 'signs', 'thresholds', 'messages')
+    
+    def __init__(self, rules):
+        # (field, comparison, threshold, message) rules, with the field
+        # resolved to its issue_key position and the rule's bit in a mask
+        self.rules = tuple(
+            (ISSUE_SCORE_FIELDS.index(field), compare, threshold, 1 << position, message)
+            for position, (field, compare, threshold, message) in enumerate(rules)
+        )
+        
+        # Array form for a whole batch; negating both sides turns
+        # score > threshold into -score < -threshold
+        self.columns = np.array([index for index, _, _, _, _ in self.rules])
+        self.signs = np.array([1.0 if compare is operator.lt else -1.0 for _, compare, _, _, _ in self.rules])
+        self.thresholds = np.array([threshold for _, _, threshold, _, _ in self.rules]) * self.signs
+        
+        # Message tuples memoized by the bitmask of fired rules, the only
+        # thing the messages depend on, so metrics firing the same rules
+        # share one tuple; the cache holds every possible mask
+        self.messages = lru_cache(maxsize=2 ** len(self.rules))(self._messages)
+    
+    def mask(self, scores: Tuple[float, ...]) -> int:
+        """Bitmask of the rules fired by one issue_key"""
+        # Each comparison's bool is multiplied into its bit, so the fold has
+        # no data-dependent branches
+        mask = 0
+        for index, compare, threshold, bit, _ in self.rules:
+            mask |= compare(scores[index], threshold) * bit
+        return mask
+    
+    def batch_masks(self, scores: np.ndarray) -> List[int]:
+        """Bitmasks of the rules fired by each row of a score_vector matrix, from one comparison"""
+        fired = scores[:, self.columns] * self.signs < self.thresholds
+        return (fired @ (1 << np.arange(len(self.rules)))).tolist()
+    
+    def _messages(self, mask: int) -> Tuple[str, ...]:
+        """Messages of the rules set in mask, in rule order"""
+        return tuple(message for _, _, _, bit, message in self.rules if mask & bit)
+
+
+# A rule fires when compare(score, threshold) holds; higher bias is worse
+ISSUE_RULES = ScoreRules((
+    ('confidence_score', operator.lt, 0.5, "Low confidence indicators - claim may be speculative"),
+    ('clarity_score', operator.lt, 0.6, "Poor clarity - complex sentence structure or terminology"),
+    ('specificity_score', operator.lt, 0.4, "Lacks specificity - too vague or general"),
+    ('evidence_score', operator.lt, 0.3, "Insufficient evidence - lacks supporting data or sources"),
+    ('bias_score', operator.gt, 0.6, "Potential bias detected - emotional or loaded language"),
+    ('factuality_score', operator.lt, 0.5, "Low factual content - may be opinion-based"),
+    ('completeness_score', operator.lt, 0.5, "Incomplete claim - missing essential context or details"),
+    ('reasoning_score', operator.lt, 0.4, "Weak reasoning - lacks logical connections or justification"),
+))
+
+RECOMMENDATION_RULES = ScoreRules((
+    ('confidence_score', operator.lt, 0.6, "Add confidence qualifiers or strengthen evidence"),
+    ('clarity_score', operator.lt, 0.7, "Simplify language and sentence structure"),
+    ('specificity_score', operator.lt, 0.5, "Include specific numbers, dates, or entities"),
+    ('evidence_score', operator.lt, 0.4, "Provide citations and supporting data"),
+    ('bias_score', operator.gt, 0.5, "Use more neutral, objective language"),
+    ('completeness_score', operator.lt, 0.6, "Add context about scope, conditions, or limitations"),
+    ('reasoning_score', operator.lt, 0.5, "Include logical connectors and causal relationships"),
+))
+
+
+def _cache_stats(hits: int, misses: int, size: int, maxsize: int) -> Dict:
+    """Cache counters with the hit rate, hits / (hits + misses)"""
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'size': size,
+        'maxsize': maxsize,
+        'hit_rate': hits / lookups if lookups else 0.0
+    }
+
+
+# Shared result for metrics that fire no rule
+NO_MESSAGES: Tuple[str, ...] = ()
+
+
+def _quality_issues(scores: Tuple[float, ...]) -> Tuple[str, ...]:
+    """Quality issues for a QualityMetrics.issue_key"""
+    # Well-scored claims fire no rule and skip the message lookup
+    mask = ISSUE_RULES.mask(scores)
+    if not mask:
+        return NO_MESSAGES
+    
+    return ISSUE_RULES.messages(mask)
+
+
+def _quality_recommendations(scores: Tuple[float, ...]) -> Tuple[str, ...]:
+    """Improvement recommendations for a QualityMetrics.issue_key"""
+    # Same early exit when no RECOMMENDATION_RULES threshold is crossed
+    mask = RECOMMENDATION_RULES.mask(scores)
+    if not mask:
+        return NO_MESSAGES
+    
+    return RECOMMENDATION_RULES.messages(mask)
 
 
 class QualityScorer:
     """Service for assessing claim quality and reliability"""
     
     def __init__(self):
-        self.nlp = None
-        self.sentiment_analyzer = None
-        self.factuality_checker = None
-        self.bias_detector = None
+        # Models are resolved lazily through the properties below
+        self._nlp = None
+        self._sentiment_analyzer = None
+        self._bias_detector = None
         self.readability_analyzer = None
         
+        # Texts per forward pass when scoring sentiment for several claims,
+        # and the token limit each text is truncated to
+        self.sentiment_batch_size = 32
+        self.max_sequence_length = 256
+        
+        # Texts per spaCy pipe batch
+        self.parse_batch_size = 64
+        
+        # LRU cache of the assessments that depend only on the claim text, so
+        # re-evaluated claims skip sentiment inference and parsing
+        self.text_assessment_cache = OrderedDict()
+        self.text_assessment_cache_size = int(os.getenv("QUALITY_CACHE_SIZE", "4096"))
+        self.text_assessment_cache_hits = 0
+        self.text_assessment_cache_misses = 0
+        
+        # Cache statistics are logged every this many text assessments (0 disables)
+        self.cache_stats_log_interval = int(os.getenv("QUALITY_CACHE_STATS_INTERVAL", "1000"))
+        
+        # One automaton over every phrase table, so a single scan of the text
+        # finds the matched phrases of all categories
+        self.phrase_automaton = _build_phrase_automaton()
+        
+        # Evidence piece weights for source, strength and quantitative counts
+        self.evidence_piece_weights = np.array([0.4, 0.3, 0.3])
+        
+        # Patterns for the structural and semantic features
+        self.number_pattern = re.compile(r'\d+')
+        self.url_pattern = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+        self.capitalized_pattern = re.compile(r'\b[A-Z][A-Z]+\b')
+        self.semantic_category_patterns = {
+            'temporal': re.compile(r'\b(now|then|today|yesterday|tomorrow|recently|currently)\b'),
+            'causal': re.compile(r'\b(because|since|due to|caused by|results in|leads to)\b'),
+            'comparative': re.compile(r'\b(more|less|better|worse|higher|lower|increased|decreased)\b'),
+            'quantitative': re.compile(r'\b(percent|percentage|number|amount|rate|ratio|significant)\b')
+        }
+        
         # Quality assessment criteria
         self.quality_criteria = {
             'clarity': {
@@ -72,37 +510,48 @@ class QualityScorer:
                 'confirmation_bias': 0.3
             }
         }
-        
-        # Initialize models
-        asyncio.create_task(self._load_models())
+
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use"""
+        if self._nlp is None:
+            self._nlp = _get_shared_model(_load_spacy_model)
+        return self._nlp
+    
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp = value
+    
+    @property
+    def sentiment_analyzer(self):
+        """Sentiment (tokenizer, model) pair, loaded on first use"""
+        if self._sentiment_analyzer is None:
+            self._sentiment_analyzer = _get_shared_model(_load_sentiment_analyzer)
+        return self._sentiment_analyzer
+    
+    @sentiment_analyzer.setter
+    def sentiment_analyzer(self, value):
+        self._sentiment_analyzer = value
+    
+    @property
+    def bias_detector(self):
+        """Bias detection (tokenizer, model) pair, loaded on first use"""
+        if self._bias_detector is None:
+            self._bias_detector = _get_shared_model(_load_bias_detector)
+        return self._bias_detector
+    
+    @bias_detector.setter
+    def bias_detector(self, value):
+        self._bias_detector = value
     
     async def _load_models(self):
-        """Load all required models for quality scoring"""
+        """Load all quality scoring models up front instead of on first use"""
         try:
             logger.info("Loading quality scoring models...")
             
-            # Load spaCy for linguistic analysis
-            self.nlp = spacy.load("en_core_web_sm")
-            
-            # Load sentiment analysis pipeline
-            self.sentiment_analyzer = pipeline(
-                "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest",
-                return_all_scores=True
-            )
-            
-            # Load factuality checker
-            self.factuality_checker = pipeline(
-                "text-classification",
-                model="facebook/bart-large-mnli",
-                return_all_scores=True
-            )
-            
-            # Load bias detection pipeline
-            self.bias_detector = pipeline(
-                "text-classification",
-                model="martin-ha/toxic-comment-model",
-                return_all_scores=True
+            await asyncio.to_thread(
+                lambda: (self.nlp, self.sentiment_analyzer, self.bias_detector)
             )
             
             logger.info("Quality scoring models loaded successfully")
@@ -111,98 +560,245 @@ class QualityScorer:
             logger.error(f"Failed to load quality scoring models: {e}")
             raise
     
+    async def assess_claims_batch(
+        self,
+        claims: List[ExtractedClaim],
+        contexts: Optional[List[str]] = None,
+        source_infos: Optional[List[Optional[Dict]]] = None,
+        evidence: Optional[List[Optional[List[str]]]] = None
+    ) -> List[QualityMetrics]:
+        """Assess the quality of several claims with one batched sentiment pass"""
+        contexts = contexts or [""] * len(claims)
+        source_infos = source_infos or [None] * len(claims)
+        evidence = evidence or [None] * len(claims)
+        
+        # Sentiment and parses are only needed for texts not already cached.
+        # Both run in worker threads, so the transformer forward passes
+        # overlap the spaCy pipeline.
+        texts = list(dict.fromkeys(
+            claim.text for claim in claims if claim.text not in self.text_assessment_cache
+        ))
+        sentiment_results, parsed_docs = await asyncio.gather(
+            self._analyze_sentiments(texts), self._parse_texts(texts)
+        )
+        sentiments = dict(zip(texts, sentiment_results))
+        docs = dict(zip(texts, parsed_docs))
+        
+        assessed = await asyncio.gather(*(
+            self._assess_dimensions(
+                claim, context, source_info, claim_evidence,
+                sentiments.get(claim.text), docs.get(claim.text)
+            )
+            for claim, context, source_info, claim_evidence
+            in zip(claims, contexts, source_infos, evidence)
+        ))
+        
+        # Overall scores for every successfully assessed claim in one product
+        scored = [metrics for metrics in assessed if metrics is not None]
+        if scored:
+            scores = np.array([metrics.score_vector() for metrics in scored])
+            overall_scores = scores @ OVERALL_SCORE_WEIGHTS + OVERALL_SCORE_OFFSET
+            
+            # Issue and recommendation thresholds for the whole batch at once
+            issues = [ISSUE_RULES.messages(mask) for mask in ISSUE_RULES.batch_masks(scores)]
+            recommendations = [
+                RECOMMENDATION_RULES.messages(mask) for mask in RECOMMENDATION_RULES.batch_masks(scores)
+            ]
+            
+            for metrics, overall_score, metrics_issues, metrics_recommendations in zip(
+                scored, overall_scores.tolist(), issues, recommendations
+            ):
+                metrics.overall_score = overall_score
+                metrics.issues = metrics_issues
+                metrics.recommendations = metrics_recommendations
+        
+        return [metrics if metrics is not None else QualityMetrics() for metrics in assessed]
+    
     async def assess_claim_quality(
         self,
         claim: ExtractedClaim,
         context: str = "",
         source_info: Optional[Dict] = None,
-        evidence: Optional[List[str]] = None
+        evidence: Optional[List[str]] = None,
+        sentiment_scores: Optional[Dict[str, float]] = None,
+        doc=None
     ) -> QualityMetrics:
         """Assess the overall quality of a claim"""
+        metrics = await self._assess_dimensions(claim, context, source_info, evidence, sentiment_scores, doc)
+        if metrics is None:
+            return QualityMetrics()
+        
+        # Calculate overall quality score
+        metrics.overall_score = float(
+            np.dot(metrics.score_vector(), OVERALL_SCORE_WEIGHTS) + OVERALL_SCORE_OFFSET
+        )
+        self._add_issues_and_recommendations(metrics)
         
+        return metrics
+    
+    async def _assess_dimensions(
+        self,
+        claim: ExtractedClaim,
+        context: str = "",
+        source_info: Optional[Dict] = None,
+        evidence: Optional[List[str]] = None,
+        sentiment_scores: Optional[Dict[str, float]] = None,
+        doc=None
+    ) -> Optional[QualityMetrics]:
+        """Assess every quality dimension and feature of a claim, without the overall score"""
         try:
             metrics = QualityMetrics()
             
-            # Assess different quality dimensions
-            metrics.confidence_score = await self._assess_confidence(claim, context)
-            metrics.clarity_score = await self._assess_clarity(claim.text)
-            metrics.specificity_score = await self._assess_specificity(claim.text)
-            metrics.evidence_score = await self._assess_evidence_quality(claim, evidence or [])
-            metrics.bias_score = await self._assess_bias(claim.text)
-            metrics.factuality_score = await self._assess_factuality(claim.text)
-            metrics.completeness_score = await self._assess_completeness(claim.text, context)
-            metrics.reasoning_score = await self._assess_reasoning_quality(claim.text, context)
-            metrics.source_reliability = await self._assess_source_reliability(source_info)
-            
-            # Extract detailed features
-            metrics.linguistic_features = await self._extract_linguistic_features(claim.text)
-            metrics.structural_features = await self._extract_structural_features(claim.text)
-            metrics.semantic_features = await self._extract_semantic_features(claim.text)
-            
-            # Calculate overall quality score
-            weights = {
-                'confidence': 0.15,
-                'clarity': 0.15,
-                'specificity': 0.12,
-                'evidence': 0.18,
-                'bias': 0.10,
-                'factuality': 0.15,
-                'completeness': 0.08,
-                'reasoning': 0.05,
-                'source': 0.02
-            }
-            
-            metrics.overall_score = (
-                metrics.confidence_score * weights['confidence'] +
-                metrics.clarity_score * weights['clarity'] +
-                metrics.specificity_score * weights['specificity'] +
-                metrics.evidence_score * weights['evidence'] +
-                (1.0 - metrics.bias_score) * weights['bias'] +  # Lower bias is better
-                metrics.factuality_score * weights['factuality'] +
-                metrics.completeness_score * weights['completeness'] +
-                metrics.reasoning_score * weights['reasoning'] +
-                metrics.source_reliability * weights['source']
+            # Assess the text-only quality dimensions and features
+            text_assessment = await self._assess_text(claim.text, context, sentiment_scores, doc)
+            # Deep copies, so nested values never alias the cached assessment
+            for name, value in text_assessment.items():
+                setattr(metrics, name, copy.deepcopy(value))
+            
+            # Assess the dimensions that depend on more than the text;
+            # parsing the evidence is CPU-bound, so it runs off the event loop
+            metrics.confidence_score = self._assess_confidence(claim, context)
+            metrics.evidence_score = await asyncio.to_thread(
+                self._assess_evidence_quality, claim, evidence or []
             )
-            
-            # Identify issues and generate recommendations
-            metrics.issues = await self._identify_quality_issues(metrics)
-            metrics.recommendations = await self._generate_recommendations(metrics)
+            metrics.source_reliability = self._assess_source_reliability(source_info)
             
             return metrics
             
         except Exception as e:
             logger.error(f"Quality assessment failed: {e}")
-            return QualityMetrics()
+            return None
     
-    async def _assess_confidence(self, claim: ExtractedClaim, context: str) -> float:
-        """Assess confidence level of the claim"""
+    async def _assess_text(
+        self,
+        text: str,
+        context: str = "",
+        sentiment_scores: Optional[Dict[str, float]] = None,
+        doc=None
+    ) -> Dict:
+        """Assess the quality dimensions and features that depend only on the claim text"""
+        cached = self.text_assessment_cache.get(text)
+        if cached is not None:
+            self.text_assessment_cache_hits += 1
+        else:
+            self.text_assessment_cache_misses += 1
+        
+        lookups = self.text_assessment_cache_hits + self.text_assessment_cache_misses
+        if self.cache_stats_log_interval > 0 and lookups % self.cache_stats_log_interval == 0:
+            self._log_cache_stats()
+        
+        if cached is not None:
+            self.text_assessment_cache.move_to_end(text)
+            return cached
+        
+        # Sentiment is shared by the bias and semantic assessments
+        if sentiment_scores is None:
+            sentiment_scores = (await self._analyze_sentiments([text]))[0]
+        
+        # Parsing and the assessments are CPU-bound, so they run off the event loop
+        text_assessment = await asyncio.to_thread(
+            self._compute_text_assessment, text, context, sentiment_scores, doc
+        )
+        
+        # Results computed without sentiment (a failed inference) are not cached
+        if sentiment_scores and self.text_assessment_cache_size > 0:
+            self.text_assessment_cache[text] = text_assessment
+            if len(self.text_assessment_cache) > self.text_assessment_cache_size:
+                self.text_assessment_cache.popitem(last=False)
+        
+        return text_assessment
+    
+    def _compute_text_assessment(
+        self,
+        text: str,
+        context: str,
+        sentiment_scores: Dict[str, float],
+        doc=None
+    ) -> Dict:
+        """Run the text-only assessments, parsing the claim once when no Doc is given"""
+        parsed = ParsedText(text, doc if doc is not None else self.nlp(text))
+        
+        # Completeness and reasoning take the context but do not use it
+        return {
+            'clarity_score': self._assess_clarity(parsed),
+            'specificity_score': self._assess_specificity(parsed),
+            'bias_score': self._assess_bias(parsed, sentiment_scores),
+            'factuality_score': self._assess_factuality(parsed),
+            'completeness_score': self._assess_completeness(parsed, context),
+            'reasoning_score': self._assess_reasoning_quality(parsed, context),
+            'linguistic_features': self._extract_linguistic_features(parsed),
+            'structural_features': self._extract_structural_features(text),
+            'semantic_features': self._extract_semantic_features(parsed, sentiment_scores)
+        }
+    
+    def _add_issues_and_recommendations(self, metrics: QualityMetrics):
+        """Identify issues and generate recommendations for scored metrics"""
+        metrics.issues = self._identify_quality_issues(metrics)
+        metrics.recommendations = self._generate_recommendations(metrics)
+    
+    async def _analyze_sentiments(self, texts: List[str]) -> List[Dict[str, float]]:
+        """Score sentiment labels for each text in batched forward passes"""
         try:
-            confidence_indicators = {
-                'high_confidence': [
-                    'proven', 'demonstrated', 'established', 'confirmed', 'verified',
-                    'conclusive', 'definitive', 'certain', 'undeniable', 'fact'
-                ],
-                'medium_confidence': [
-                    'evidence suggests', 'indicates', 'shows', 'research shows',
-                    'studies indicate', 'data suggests', 'findings show'
-                ],
-                'low_confidence': [
-                    'might', 'could', 'may', 'possibly', 'perhaps', 'seems',
-                    'appears', 'suggests', 'implies', 'potentially'
-                ],
-                'uncertainty': [
-                    'unclear', 'uncertain', 'ambiguous', 'debatable', 'controversial',
-                    'disputed', 'questionable', 'unconfirmed', 'alleged'
-                ]
-            }
+            if not texts:
+                return []
             
-            text_lower = claim.text.lower()
+            # Loading the model on first use and inference are both
+            # synchronous, so keep them off the event loop
+            return await asyncio.to_thread(self._score_sentiments, texts)
             
+        except Exception as e:
+            logger.error(f"Sentiment analysis failed: {e}")
+            return [{} for _ in texts]
+    
+    def _score_sentiments(self, texts: List[str]) -> List[Dict[str, float]]:
+        """Sentiment label probabilities for each text, resolving the lazily loaded model on this thread"""
+        classifier = self.sentiment_analyzer
+        probabilities = self._run_classifier(classifier, texts)
+        
+        # Label names in column order, so each row maps with a single zip
+        id2label = classifier[1].config.id2label
+        labels = [id2label[i] for i in range(probabilities.shape[1])]
+        return [dict(zip(labels, row)) for row in probabilities.tolist()]
+    
+    def _run_classifier(self, classifier: Tuple, texts: List[str]) -> np.ndarray:
+        """Class probabilities for each text from a (tokenizer, model) classifier"""
+        tokenizer, model = classifier
+        
+        # Batch texts of similar length together to minimize padding
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        probabilities = np.empty((len(texts), model.config.num_labels), dtype=np.float32)
+        
+        with torch.inference_mode():
+            for start in range(0, len(texts), self.sentiment_batch_size):
+                batch = order[start:start + self.sentiment_batch_size]
+                encoded = tokenizer(
+                    [texts[i] for i in batch],
+                    padding=True,
+                    truncation=True,
+                    max_length=self.max_sequence_length,
+                    return_tensors="pt"
+                ).to(model.device)
+                logits = model(**encoded).logits
+                probabilities[batch] = logits.float().softmax(dim=-1).cpu().numpy()
+        
+        return probabilities
+    
+    async def _parse_texts(self, texts: List[str]) -> List:
+        """Parse texts with spaCy in batches"""
+        if not texts:
+            return []
+        
+        return await asyncio.to_thread(
+            lambda: list(self.nlp.pipe(texts, batch_size=self.parse_batch_size))
+        )
+    
+    def _assess_confidence(self, claim: ExtractedClaim, context: str) -> float:
+        """Assess confidence level of the claim"""
+        try:
             # Score based on confidence indicators
-            high_count = sum(1 for phrase in confidence_indicators['high_confidence'] if phrase in text_lower)
-            medium_count = sum(1 for phrase in confidence_indicators['medium_confidence'] if phrase in text_lower)
-            low_count = sum(1 for phrase in confidence_indicators['low_confidence'] if phrase in text_lower)
-            uncertainty_count = sum(1 for phrase in confidence_indicators['uncertainty'] if phrase in text_lower)
+            high_count, medium_count, low_count, uncertainty_count = self._count_phrases(
+                claim.text.lower(), 'high_confidence', 'medium_confidence', 'low_confidence', 'uncertainty'
+            )
             
             # Calculate confidence score
             confidence_score = (
@@ -227,14 +823,14 @@ class QualityScorer:
             logger.error(f"Confidence assessment failed: {e}")
             return 0.5
     
-    async def _assess_clarity(self, text: str) -> float:
+    def _assess_clarity(self, parsed: ParsedText) -> float:
         """Assess clarity and readability of the claim"""
         try:
-            doc = self.nlp(text)
+            doc = parsed.doc
             
             # Readability metrics
-            sentence_count = len(list(doc.sents))
-            word_count = len([token for token in doc if not token.is_punct])
+            sentence_count = parsed.sentence_count
+            word_count = parsed.word_count
             
             if sentence_count == 0 or word_count == 0:
                 return 0.0
@@ -242,19 +838,15 @@ class QualityScorer:
             avg_sentence_length = word_count / sentence_count
             
             # Flesch Reading Ease approximation
-            syllable_count = sum(self._count_syllables(token.text) for token in doc if token.is_alpha)
+            syllable_count = sum(self._count_syllables(token.text) for token in parsed.alpha_tokens)
             if word_count > 0 and sentence_count > 0:
                 flesch_score = 206.835 - (1.015 * avg_sentence_length) - (84.6 * syllable_count / word_count)
                 readability_score = max(0, min(100, flesch_score)) / 100
             else:
                 readability_score = 0.5
             
-            # Sentence structure complexity
-            complex_structures = 0
-            for sent in doc.sents:
-                # Count subordinate clauses, passive voice, etc.
-                if any(token.dep_ in ['csubj', 'ccomp', 'advcl'] for token in sent):
-                    complex_structures += 1
+            # Sentence structure complexity: sentences with subordinate clauses
+            complex_structures = parsed.complex_sentence_count
             
             structure_score = max(0, 1.0 - (complex_structures / max(1, sentence_count)) * 0.5)
             
@@ -279,58 +871,42 @@ class QualityScorer:
             logger.error(f"Clarity assessment failed: {e}")
             return 0.5
     
-    def _count_syllables(self, word: str) -> int:
-        """Count syllables in a word (approximation)"""
-        word = word.lower()
-        if not word:
-            return 0
-        
-        vowels = 'aeiouy'
-        syllable_count = 0
-        prev_was_vowel = False
-        
-        for char in word:
-            if char in vowels:
-                if not prev_was_vowel:
-                    syllable_count += 1
-                prev_was_vowel = True
-            else:
-                prev_was_vowel = False
+    def _count_phrases(self, text_lower: str, *categories: str) -> List[int]:
+        """Count the distinct phrases of each category that occur in the lowercased text"""
+        if self.phrase_automaton is None:
+            return [
+                sum(1 for phrase in PHRASE_TABLES[category] if phrase in text_lower)
+                for category in categories
+            ]
         
-        # Handle silent e
-        if word.endswith('e'):
-            syllable_count -= 1
+        # Collect each matched phrase once, then tally it under its categories
+        matched = {value for _, value in self.phrase_automaton.iter(text_lower)}
+        counts = Counter(category for _, phrase_categories in matched for category in phrase_categories)
         
-        return max(1, syllable_count)
+        return [counts[category] for category in categories]
     
-    async def _assess_specificity(self, text: str) -> float:
+    def _count_syllables(self, word: str) -> int:
+        """Count syllables in a word (approximation)"""
+        return _count_word_syllables(word.lower())
+    
+    def _assess_specificity(self, parsed: ParsedText) -> float:
         """Assess how specific and precise the claim is"""
         try:
-            doc = self.nlp(text)
-            
             # Count specific elements
-            numbers = len([token for token in doc if token.like_num])
-            dates = len([ent for ent in doc.ents if ent.label_ in ['DATE', 'TIME']])
-            organizations = len([ent for ent in doc.ents if ent.label_ == 'ORG'])
-            people = len([ent for ent in doc.ents if ent.label_ == 'PERSON'])
-            locations = len([ent for ent in doc.ents if ent.label_ in ['GPE', 'LOC']])
-            
-            # Quantitative terms
-            quantitative_terms = [
-                'percent', 'percentage', 'ratio', 'rate', 'correlation', 'significant',
-                'study', 'research', 'data', 'analysis', 'measurement', 'experiment'
-            ]
-            quant_count = sum(1 for term in quantitative_terms if term in text.lower())
-            
-            # Vague terms (reduce specificity)
-            vague_terms = [
-                'some', 'many', 'several', 'various', 'numerous', 'often', 'sometimes',
-                'generally', 'usually', 'mostly', 'largely', 'somewhat', 'quite'
-            ]
-            vague_count = sum(1 for term in vague_terms if term in text.lower())
+            entity_counts = parsed.entity_counts
+            numbers = parsed.number_count
+            dates = entity_counts['DATE'] + entity_counts['TIME']
+            organizations = entity_counts['ORG']
+            people = entity_counts['PERSON']
+            locations = entity_counts['GPE'] + entity_counts['LOC']
+            
+            # Quantitative terms, and vague terms (reduce specificity)
+            quant_count, vague_count = self._count_phrases(
+                parsed.text_lower, 'quantitative_terms', 'vague_terms'
+            )
             
             # Calculate specificity score
-            word_count = len([token for token in doc if not token.is_punct])
+            word_count = parsed.word_count
             if word_count == 0:
                 return 0.0
             
@@ -344,42 +920,29 @@ class QualityScorer:
             logger.error(f"Specificity assessment failed: {e}")
             return 0.5
     
-    async def _assess_evidence_quality(self, claim: ExtractedClaim, evidence: List[str]) -> float:
+    def _assess_evidence_quality(self, claim: ExtractedClaim, evidence: List[str]) -> float:
         """Assess the quality of supporting evidence"""
         try:
             if not evidence:
                 return 0.1  # No evidence provided
             
-            evidence_scores = []
-            
-            for evidence_text in evidence:
-                # Assess individual evidence quality
-                doc = self.nlp(evidence_text)
-                
-                # Source quality indicators
-                source_indicators = [
-                    'study', 'research', 'experiment', 'analysis', 'survey',
-                    'journal', 'published', 'peer-reviewed', 'data', 'statistics'
-                ]
-                source_score = sum(1 for indicator in source_indicators if indicator in evidence_text.lower())
-                
-                # Quantitative evidence
-                numbers = len([token for token in doc if token.like_num])
-                dates = len([ent for ent in doc.ents if ent.label_ in ['DATE', 'TIME']])
-                
-                # Evidence strength
-                strength_indicators = [
-                    'significant', 'conclusive', 'demonstrated', 'proven', 'confirmed',
-                    'correlation', 'p-value', 'confidence interval', 'effect size'
-                ]
-                strength_score = sum(1 for indicator in strength_indicators if indicator in evidence_text.lower())
-                
-                # Calculate evidence piece score
-                piece_score = (source_score * 0.4 + (numbers + dates) * 0.3 + strength_score * 0.3) / 5
-                evidence_scores.append(min(1.0, piece_score))
-            
-            # Overall evidence quality
-            avg_evidence_quality = np.mean(evidence_scores)
+            # Parse every evidence piece in one batch
+            evidence_docs = self.nlp.pipe(evidence, batch_size=self.parse_batch_size)
+            
+            # Per-piece counts of source quality indicators, quantitative
+            # evidence (numbers and dates) and evidence strength indicators
+            parsed_evidence = [ParsedText(text, doc) for text, doc in zip(evidence, evidence_docs)]
+            piece_counts = np.array([
+                (
+                    *self._count_phrases(parsed.text_lower, 'source_indicators', 'strength_indicators'),
+                    parsed.number_count + parsed.entity_counts['DATE'] + parsed.entity_counts['TIME']
+                )
+                for parsed in parsed_evidence
+            ], dtype=np.float64)
+            
+            # Score every evidence piece at once and average them
+            piece_scores = np.minimum(1.0, piece_counts @ self.evidence_piece_weights / 5)
+            avg_evidence_quality = float(piece_scores.mean())
             evidence_quantity_bonus = min(0.2, len(evidence) * 0.1)  # Bonus for multiple evidence pieces
             
             return min(1.0, avg_evidence_quality + evidence_quantity_bonus)
@@ -388,49 +951,24 @@ class QualityScorer:
             logger.error(f"Evidence quality assessment failed: {e}")
             return 0.3
     
-    async def _assess_bias(self, text: str) -> float:
+    def _assess_bias(self, parsed: ParsedText, sentiment_scores: Dict[str, float]) -> float:
         """Assess potential bias in the claim"""
         try:
             # Language bias indicators
-            bias_indicators = {
-                'emotional': [
-                    'amazing', 'terrible', 'fantastic', 'awful', 'incredible', 'shocking',
-                    'outrageous', 'brilliant', 'catastrophic', 'devastating'
-                ],
-                'absolute': [
-                    'always', 'never', 'all', 'none', 'every', 'no one', 'everyone',
-                    'completely', 'totally', 'absolutely', 'perfectly'
-                ],
-                'loaded': [
-                    'obviously', 'clearly', 'undoubtedly', 'certainly', 'definitely',
-                    'surely', 'of course', 'needless to say'
-                ]
-            }
-            
-            text_lower = text.lower()
-            bias_score = 0.0
-            
-            for bias_type, indicators in bias_indicators.items():
-                count = sum(1 for indicator in indicators if indicator in text_lower)
-                if bias_type == 'emotional':
-                    bias_score += count * 0.3
-                elif bias_type == 'absolute':
-                    bias_score += count * 0.2
-                elif bias_type == 'loaded':
-                    bias_score += count * 0.1
+            emotional_count, absolute_count, loaded_count = self._count_phrases(
+                parsed.text_lower, 'emotional_bias', 'absolute_bias', 'loaded_bias'
+            )
+            bias_score = emotional_count * 0.3 + absolute_count * 0.2 + loaded_count * 0.1
             
             # Sentiment analysis for emotional bias
-            sentiment_result = self.sentiment_analyzer(text)
-            if sentiment_result:
-                sentiment_scores = {item['label']: item['score'] for item in sentiment_result[0]}
+            if sentiment_scores:
                 # High positive or negative sentiment indicates potential bias
                 max_sentiment = max(sentiment_scores.values())
                 if max_sentiment > 0.8:
                     bias_score += 0.2
             
             # Normalize bias score
-            word_count = len(text.split())
-            normalized_bias = bias_score / max(1, word_count) * 10
+            normalized_bias = bias_score / max(1, parsed.whitespace_word_count) * 10
             
             return min(1.0, normalized_bias)
             
@@ -438,32 +976,19 @@ class QualityScorer:
             logger.error(f"Bias assessment failed: {e}")
             return 0.5
     
-    async def _assess_factuality(self, text: str) -> float:
+    def _assess_factuality(self, parsed: ParsedText) -> float:
         """Assess the factual nature of the claim"""
         try:
-            # Factual indicators
-            factual_indicators = [
-                'research shows', 'study found', 'data indicates', 'statistics show',
-                'according to', 'published in', 'peer-reviewed', 'empirical evidence',
-                'experimental results', 'clinical trial', 'meta-analysis'
-            ]
-            
-            # Opinion indicators (reduce factuality)
-            opinion_indicators = [
-                'i think', 'i believe', 'in my opinion', 'personally', 'i feel',
-                'seems to me', 'i suspect', 'my view', 'i would argue'
-            ]
-            
-            text_lower = text.lower()
-            
-            factual_count = sum(1 for indicator in factual_indicators if indicator in text_lower)
-            opinion_count = sum(1 for indicator in opinion_indicators if indicator in text_lower)
+            # Factual indicators, and opinion indicators (reduce factuality)
+            factual_count, opinion_count = self._count_phrases(
+                parsed.text_lower, 'factual_indicators', 'opinion_indicators'
+            )
             
             # Check for verifiable elements
-            doc = self.nlp(text)
-            numbers = len([token for token in doc if token.like_num])
-            dates = len([ent for ent in doc.ents if ent.label_ in ['DATE', 'TIME']])
-            organizations = len([ent for ent in doc.ents if ent.label_ == 'ORG'])
+            entity_counts = parsed.entity_counts
+            numbers = parsed.number_count
+            dates = entity_counts['DATE'] + entity_counts['TIME']
+            organizations = entity_counts['ORG']
             
             verifiable_elements = numbers + dates + organizations
             
@@ -475,8 +1000,7 @@ class QualityScorer:
             )
             
             # Normalize
-            word_count = len(text.split())
-            normalized_factuality = factuality_score / max(1, word_count) * 20
+            normalized_factuality = factuality_score / max(1, parsed.whitespace_word_count) * 20
             
             return max(0.0, min(1.0, normalized_factuality + 0.5))  # Base score of 0.5
             
@@ -484,24 +1008,32 @@ class QualityScorer:
             logger.error(f"Factuality assessment failed: {e}")
             return 0.5
     
-    async def _assess_completeness(self, text: str, context: str) -> float:
+    def _assess_completeness(self, parsed: ParsedText, context: str) -> float:
         """Assess how complete the claim is"""
         try:
-            # Check for essential elements
-            doc = self.nlp(text)
-            
-            has_subject = any(token.dep_ in ['nsubj', 'nsubjpass'] for token in doc)
-            has_predicate = any(token.pos_ == 'VERB' for token in doc)
-            has_object = any(token.dep_ in ['dobj', 'pobj'] for token in doc)
+            # Check for essential elements in one pass, stopping once all are found
+            has_subject = has_predicate = has_object = False
+            for token in parsed.doc:
+                dep = token.dep_
+                if dep in SUBJECT_DEPS:
+                    has_subject = True
+                elif dep in OBJECT_DEPS:
+                    has_object = True
+                if token.pos_ == 'VERB':
+                    has_predicate = True
+                if has_subject and has_predicate and has_object:
+                    break
             
             # Check for context elements
-            has_time_reference = any(ent.label_ in ['DATE', 'TIME'] for ent in doc.ents)
-            has_location_reference = any(ent.label_ in ['GPE', 'LOC'] for ent in doc.ents)
-            has_source_reference = any(ent.label_ == 'ORG' for ent in doc.ents)
+            entity_counts = parsed.entity_counts
+            has_time_reference = entity_counts['DATE'] + entity_counts['TIME'] > 0
+            has_location_reference = entity_counts['GPE'] + entity_counts['LOC'] > 0
+            has_source_reference = entity_counts['ORG'] > 0
             
             # Check for qualifying information
-            has_conditions = any(word in text.lower() for word in ['if', 'when', 'unless', 'provided', 'assuming'])
-            has_scope = any(word in text.lower() for word in ['some', 'most', 'many', 'few', 'certain'])
+            condition_count, scope_count = self._count_phrases(parsed.text_lower, 'conditions', 'scope')
+            has_conditions = condition_count > 0
+            has_scope = scope_count > 0
             
             # Calculate completeness score
             structure_score = (has_subject + has_predicate + has_object) / 3
@@ -520,38 +1052,18 @@ class QualityScorer:
             logger.error(f"Completeness assessment failed: {e}")
             return 0.5
     
-    async def _assess_reasoning_quality(self, text: str, context: str) -> float:
+    def _assess_reasoning_quality(self, parsed: ParsedText, context: str) -> float:
         """Assess the quality of reasoning in the claim"""
         try:
-            # Logical connectors
-            logical_connectors = [
-                'because', 'therefore', 'thus', 'hence', 'consequently', 'as a result',
-                'since', 'due to', 'owing to', 'given that', 'considering that'
-            ]
-            
-            # Causal language
-            causal_language = [
-                'causes', 'leads to', 'results in', 'brings about', 'produces',
-                'triggers', 'influences', 'affects', 'impacts', 'contributes to'
-            ]
-            
-            text_lower = text.lower()
-            
-            logical_count = sum(1 for connector in logical_connectors if connector in text_lower)
-            causal_count = sum(1 for phrase in causal_language if phrase in text_lower)
-            
-            # Check for evidence-based reasoning
-            evidence_phrases = [
-                'based on', 'according to', 'evidence shows', 'research indicates',
-                'studies demonstrate', 'data suggests', 'analysis reveals'
-            ]
-            evidence_count = sum(1 for phrase in evidence_phrases if phrase in text_lower)
+            # Logical connectors, causal language and evidence-based reasoning
+            logical_count, causal_count, evidence_count = self._count_phrases(
+                parsed.text_lower, 'logical_connectors', 'causal_language', 'evidence_phrases'
+            )
             
             # Calculate reasoning score
-            word_count = len(text.split())
             reasoning_elements = logical_count + causal_count + evidence_count
             
-            reasoning_score = reasoning_elements / max(1, word_count) * 20  # Scale up
+            reasoning_score = reasoning_elements / max(1, parsed.whitespace_word_count) * 20  # Scale up
             
             return min(1.0, reasoning_score + 0.3)  # Base score of 0.3
             
@@ -559,7 +1071,7 @@ class QualityScorer:
             logger.error(f"Reasoning quality assessment failed: {e}")
             return 0.5
     
-    async def _assess_source_reliability(self, source_info: Optional[Dict]) -> float:
+    def _assess_source_reliability(self, source_info: Optional[Dict]) -> float:
         """Assess the reliability of the source"""
         try:
             if not source_info:
@@ -580,16 +1092,11 @@ class QualityScorer:
                 'unknown': 0.5
             }
             
-            # High-quality source indicators
-            quality_indicators = [
-                'university', 'institute', 'journal', 'nature', 'science',
-                'academic', 'research', 'peer-reviewed', 'published'
-            ]
-            
             base_score = type_scores.get(source_type, 0.5)
             
-            # Bonus for quality indicators in source name
-            quality_bonus = sum(0.1 for indicator in quality_indicators if indicator in source_name)
+            # Bonus for high-quality source indicators in source name
+            quality_count, = self._count_phrases(source_name, 'source_quality')
+            quality_bonus = quality_count * 0.1
             
             return min(1.0, base_score + quality_bonus)
             
@@ -597,23 +1104,44 @@ class QualityScorer:
             logger.error(f"Source reliability assessment failed: {e}")
             return 0.5
     
-    async def _extract_linguistic_features(self, text: str) -> Dict:
+    def _extract_linguistic_features(self, parsed: ParsedText) -> Dict:
         """Extract linguistic features for detailed analysis"""
         try:
-            doc = self.nlp(text)
+            doc = parsed.doc
+            
+            # POS and dependency distributions in one pass over the doc
+            pos_counts = Counter()
+            dep_counts = Counter()
+            for token in doc:
+                pos_counts[token.pos_] += 1
+                dep_counts[token.dep_] += 1
+            
+            # Word length, syllable and complex word counts in one pass over
+            # the alphabetic tokens
+            letter_count = 0
+            syllable_count = 0
+            complex_words = 0
+            for token in parsed.alpha_tokens:
+                word_length = len(token.text)
+                letter_count += word_length
+                syllable_count += self._count_syllables(token.text)
+                if word_length > 6:
+                    complex_words += 1
+            
+            alpha_count = len(parsed.alpha_tokens)
             
             features = {
-                'word_count': len([token for token in doc if not token.is_punct]),
-                'sentence_count': len(list(doc.sents)),
-                'avg_word_length': np.mean([len(token.text) for token in doc if token.is_alpha]),
-                'pos_distribution': Counter(token.pos_ for token in doc),
-                'dependency_types': Counter(token.dep_ for token in doc),
+                'word_count': parsed.word_count,
+                'sentence_count': parsed.sentence_count,
+                'avg_word_length': letter_count / alpha_count if alpha_count else 0.0,
+                'pos_distribution': pos_counts,
+                'dependency_types': dep_counts,
                 'named_entities': len(doc.ents),
-                'entity_types': Counter(ent.label_ for ent in doc.ents),
+                'entity_types': Counter(parsed.entity_counts),
                 'readability_features': {
-                    'syllable_count': sum(self._count_syllables(token.text) for token in doc if token.is_alpha),
-                    'complex_words': len([token for token in doc if token.is_alpha and len(token.text) > 6]),
-                    'passive_voice': len([token for token in doc if token.dep_ == 'nsubjpass'])
+                    'syllable_count': syllable_count,
+                    'complex_words': complex_words,
+                    'passive_voice': dep_counts['nsubjpass']
                 }
             }
             
@@ -623,19 +1151,25 @@ class QualityScorer:
             logger.error(f"Linguistic feature extraction failed: {e}")
             return {}
     
-    async def _extract_structural_features(self, text: str) -> Dict:
+    def _extract_structural_features(self, text: str) -> Dict:
         """Extract structural features of the claim"""
         try:
+            # Each punctuation character is counted once with str.count
+            question_marks = text.count('?')
+            exclamation_marks = text.count('!')
+            
             features = {
                 'character_count': len(text),
-                'punctuation_count': len([char for char in text if char in '.,!?;:']),
-                'question_marks': text.count('?'),
-                'exclamation_marks': text.count('!'),
+                'punctuation_count': (
+                    question_marks + exclamation_marks + sum(map(text.count, SENTENCE_PUNCTUATION))
+                ),
+                'question_marks': question_marks,
+                'exclamation_marks': exclamation_marks,
                 'quotation_marks': text.count('"') + text.count("'"),
                 'parentheses': text.count('(') + text.count(')'),
-                'numbers': len(re.findall(r'\d+', text)),
-                'urls': len(re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', text)),
-                'capitalized_words': len(re.findall(r'\b[A-Z][A-Z]+\b', text))
+                'numbers': len(self.number_pattern.findall(text)),
+                'urls': len(self.url_pattern.findall(text)),
+                'capitalized_words': len(self.capitalized_pattern.findall(text))
             }
             
             return features
@@ -644,27 +1178,19 @@ class QualityScorer:
             logger.error(f"Structural feature extraction failed: {e}")
             return {}
     
-    async def _extract_semantic_features(self, text: str) -> Dict:
+    def _extract_semantic_features(self, parsed: ParsedText, sentiment_scores: Dict[str, float]) -> Dict:
         """Extract semantic features of the claim"""
         try:
-            # Sentiment analysis
-            sentiment_result = self.sentiment_analyzer(text)
-            sentiment_scores = {}
-            if sentiment_result:
-                sentiment_scores = {item['label']: item['score'] for item in sentiment_result[0]}
-            
             # Subjectivity analysis using TextBlob
-            blob = TextBlob(text)
+            blob = TextBlob(parsed.text)
             
             features = {
                 'sentiment_scores': sentiment_scores,
                 'polarity': blob.sentiment.polarity,
                 'subjectivity': blob.sentiment.subjectivity,
                 'semantic_categories': {
-                    'temporal': len(re.findall(r'\b(now|then|today|yesterday|tomorrow|recently|currently)\b', text.lower())),
-                    'causal': len(re.findall(r'\b(because|since|due to|caused by|results in|leads to)\b', text.lower())),
-                    'comparative': len(re.findall(r'\b(more|less|better|worse|higher|lower|increased|decreased)\b', text.lower())),
-                    'quantitative': len(re.findall(r'\b(percent|percentage|number|amount|rate|ratio|significant)\b', text.lower()))
+                    category: len(pattern.findall(parsed.text_lower))
+                    for category, pattern in self.semantic_category_patterns.items()
                 }
             }
             
@@ -674,69 +1200,41 @@ class QualityScorer:
             logger.error(f"Semantic feature extraction failed: {e}")
             return {}
     
-    async def _identify_quality_issues(self, metrics: QualityMetrics) -> List[str]:
-        """Identify specific quality issues"""
-        issues = []
+    def cache_stats(self) -> Dict[str, Dict]:
+        """Hit, miss and size counts of the text assessment and issue/recommendation caches"""
+        issues_info = ISSUE_RULES.messages.cache_info()
+        recommendations_info = RECOMMENDATION_RULES.messages.cache_info()
         
-        try:
-            if metrics.confidence_score < 0.5:
-                issues.append("Low confidence indicators - claim may be speculative")
-            
-            if metrics.clarity_score < 0.6:
-                issues.append("Poor clarity - complex sentence structure or terminology")
-            
-            if metrics.specificity_score < 0.4:
-                issues.append("Lacks specificity - too vague or general")
-            
-            if metrics.evidence_score < 0.3:
-                issues.append("Insufficient evidence - lacks supporting data or sources")
-            
-            if metrics.bias_score > 0.6:
-                issues.append("Potential bias detected - emotional or loaded language")
-            
-            if metrics.factuality_score < 0.5:
-                issues.append("Low factual content - may be opinion-based")
-            
-            if metrics.completeness_score < 0.5:
-                issues.append("Incomplete claim - missing essential context or details")
-            
-            if metrics.reasoning_score < 0.4:
-                issues.append("Weak reasoning - lacks logical connections or justification")
-            
-            return issues
-            
-        except Exception as e:
-            logger.error(f"Issue identification failed: {e}")
-            return []
+        return {
+            'text_assessments': _cache_stats(
+                self.text_assessment_cache_hits, self.text_assessment_cache_misses,
+                len(self.text_assessment_cache), self.text_assessment_cache_size
+            ),
+            'issues': _cache_stats(
+                issues_info.hits, issues_info.misses, issues_info.currsize, issues_info.maxsize
+            ),
+            'recommendations': _cache_stats(
+                recommendations_info.hits, recommendations_info.misses,
+                recommendations_info.currsize, recommendations_info.maxsize
+            )
+        }
+    
+    def _log_cache_stats(self):
+        """Log the hit rate and fill of each cache"""
+        # The summary is only built if an INFO record will actually be emitted
+        logger.opt(lazy=True).info("Quality scorer caches: {}", self._cache_stats_summary)
     
-    async def _generate_recommendations(self, metrics: QualityMetrics) -> List[str]:
+    def _cache_stats_summary(self) -> str:
+        """One-line summary of cache_stats"""
+        return ", ".join(
+            f"{name} hit_rate={stats['hit_rate']:.1%} size={stats['size']}/{stats['maxsize']}"
+            for name, stats in self.cache_stats().items()
+        )
+    
+    def _identify_quality_issues(self, metrics: QualityMetrics) -> Sequence[str]:
+        """Identify specific quality issues"""
+        return _quality_issues(metrics.issue_key())
+    
+    def _generate_recommendations(self, metrics: QualityMetrics) -> Sequence[str]:
         """Generate recommendations for improving claim quality"""
-        recommendations = []
-        
-        try:
-            if metrics.confidence_score < 0.6:
-                recommendations.append("Add confidence qualifiers or strengthen evidence")
-            
-            if metrics.clarity_score < 0.7:
-                recommendations.append("Simplify language and sentence structure")
-            
-            if metrics.specificity_score < 0.5:
-                recommendations.append("Include specific numbers, dates, or entities")
-            
-            if metrics.evidence_score < 0.4:
-                recommendations.append("Provide citations and supporting data")
-            
-            if metrics.bias_score > 0.5:
-                recommendations.append("Use more neutral, objective language")
-            
-            if metrics.completeness_score < 0.6:
-                recommendations.append("Add context about scope, conditions, or limitations")
-            
-            if metrics.reasoning_score < 0.5:
-                recommendations.append("Include logical connectors and causal relationships")
-            
-            return recommendations
-            
-        except Exception as e:
-            logger.error(f"Recommendation generation failed: {e}")
-            return []
\ No newline at end of file
+        return _quality_recommendations(metrics.issue_key())
\ No newline at end of file
@@ -3,11 +3,16 @@ Advanced Reasoning Chain Generator with LLM integration and logical analysis
 """
 
 import asyncio
+import hashlib
+import itertools
 import json
 import re
 import os
+import uuid
+from collections import OrderedDict
 from typing import List, Dict, Optional, Set, Tuple, Union
-from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
+import numpy as np
+from transformers import AutoTokenizer, AutoModelForCausalLM
 from loguru import logger
 from enum import Enum
 import openai
@@ -19,6 +24,25 @@ from models.schemas import (
     ReasoningStep, 
     ReasoningType
 )
+from services.shared_models import get_reasoning_generator, get_reasoning_vllm_engine
+
+# Hyperscan prefiltering of the fallacy patterns is optional
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Aho-Corasick matching of the step connecting words is optional
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# vLLM serving of the fallback generator is optional
+try:
+    from vllm import SamplingParams
+except ImportError:
+    SamplingParams = None
 
 class LogicalFallacy(str, Enum):
     AD_HOMINEM = "ad_hominem"
@@ -45,35 +69,143 @@ class LogicalGap(str, Enum):
     UNSUPPORTED_ASSUMPTION = "unsupported_assumption"
     CONTRADICTORY_EVIDENCE = "contradictory_evidence"
 
+class StepStreamParser:
+    """Incrementally parse reasoning steps from a streamed LLM response"""
+    
+    def __init__(self, step_pattern: re.Pattern):
+        self.step_pattern = step_pattern
+        self.text = ""
+        self.position = 0
+        self.steps = []
+    
+    def feed(self, chunk: str) -> List[ReasoningStep]:
+        """Add streamed text and return the steps it completed"""
+        self.text += chunk
+        
+        # A step's explanation runs to the end of its line, so steps only
+        # complete when a newline arrives
+        if "\n" not in chunk:
+            return []
+        return self._scan(final=False)
+    
+    def close(self) -> List[ReasoningStep]:
+        """Finish the stream and return the steps still pending"""
+        return self._scan(final=True)
+    
+    def _scan(self, final: bool) -> List[ReasoningStep]:
+        """Parse the steps that can no longer change as more text arrives"""
+        new_steps = []
+        
+        for match in self.step_pattern.finditer(self.text, self.position):
+            # A match running to the end of the buffer may still grow
+            if not final and match.end() == len(self.text):
+                break
+            
+            step_num, step_type, explanation = match.groups()
+            new_steps.append(ReasoningStep(
+                step_number=int(step_num),
+                text=explanation.strip(),
+                confidence=0.8,  # Default, could be enhanced with confidence detection
+                type=step_type.lower().replace(" ", "_"),
+                evidence_used=[]
+            ))
+            self.position = match.end()
+        
+        self.steps.extend(new_steps)
+        return new_steps
+
 class ReasoningChainGenerator:
     """Advanced reasoning chain generator with multi-step logical progression analysis"""
     
     def __init__(self):
         self.generator = None
+        self.vllm_engine = None
         self.tokenizer = None
         self.openai_client = None
         self.anthropic_client = None
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
         self.fallacy_patterns = self._load_fallacy_patterns()
         
-        # Initialize models and LLM clients
-        asyncio.create_task(self._load_models())
-        asyncio.create_task(self._init_llm_clients())
+        # One Hyperscan database over every fallacy pattern finds, in a single
+        # pass, which patterns can match; Python's re then only runs those.
+        # Hyperscan's \s and caseless matching agree with re's only on ASCII
+        # text without the \x1c-\x1f separators, which re treats as spaces.
+        self.fallacy_pattern_list = [
+            (fallacy, pattern)
+            for fallacy, patterns in self.fallacy_patterns.items()
+            for pattern in patterns
+        ]
+        self.fallacy_database = self._build_fallacy_database()
+        self.prefilter_unsafe_pattern = re.compile(r"[^\x00-\x1b\x20-\x7f]")
+        
+        # Words marking a step as following from the previous one, matched in
+        # a single pass over the step text when pyahocorasick is installed
+        self.connecting_words = ("therefore", "thus", "hence", "because", "since", "given that", "it follows")
+        self.connecting_automaton = self._build_connecting_automaton()
+        
+        # Detected fallacies keyed by the chain's combined text, evicted
+        # least recently used; chains are re-analyzed by the analysis endpoint
+        self.fallacy_cache = OrderedDict()
+        self.fallacy_cache_size = 1024
+        
+        # Patterns for parsing structured LLM reasoning responses
+        self.step_pattern = re.compile(r"Step\s+(\d+):\s*\[([^\]]+)\]\s*-\s*(.+)", re.IGNORECASE | re.MULTILINE)
+        # One scan finds the first header of every section; a section runs
+        # to the next line starting with a single word and a colon
+        self.sections = ("ASSUMPTIONS", "POTENTIAL WEAKNESSES", "EVIDENCE REQUIREMENTS", "COUNTERARGUMENTS")
+        self.section_header_pattern = re.compile(
+            "|".join(f"({section}):" for section in self.sections), re.IGNORECASE
+        )
+        self.section_end_pattern = re.compile(r"\n[A-Z]+:", re.IGNORECASE)
+        self.bullet_pattern = re.compile(r"^\s*(?:[-•*]|\d+[.)])\s*(.+)")
+        
+        # Instruction blocks depend only on reasoning type and complexity, so
+        # they are built once and sent as a stable system prompt prefix.
+        # At ~200 tokens they are below the ~1024-token minimum that
+        # Anthropic and OpenAI prompt caching require, so nothing is cached
+        # until the instructions grow past it.
+        self.instruction_prompts = {
+            (reasoning_type, complexity): self._build_instruction_prompt(reasoning_type, complexity)
+            for reasoning_type in ReasoningType
+            for complexity in ReasoningComplexity
+        }
+        
+        # LLM-backed responses keyed by a digest of the request, evicted least
+        # recently used; repeated claims skip the LLM round trips entirely
+        self.response_cache = OrderedDict()
+        self.response_cache_size = int(os.getenv("REASONING_CACHE_SIZE", "256"))
+    
+    async def initialize(self):
+        """Initialize models and LLM clients lazily. Call this before generating reasoning."""
+        # The lock keeps concurrent first requests from loading twice
+        async with self._init_lock:
+            if not self._initialized:
+                await self._init_llm_clients()
+                await self._load_models()
+                self._initialized = True
+    
+    async def _ensure_initialized(self):
+        """Ensure models and LLM clients are loaded before use."""
+        if not self._initialized:
+            await self.initialize()
     
     async def _load_models(self):
         """Load reasoning models"""
         try:
             logger.info("Loading reasoning engine models...")
             
-            # Load text generation pipeline for reasoning
-            self.generator = pipeline(
-                "text-generation",
-                model="microsoft/DialoGPT-medium",
-                tokenizer="microsoft/DialoGPT-medium",
-                max_length=512,
-                do_sample=True,
-                temperature=0.7,
-                pad_token_id=50256
-            )
+            # Serve the generator with vLLM when enabled, so concurrent fallback
+            # requests share continuous batching; otherwise load the text
+            # generation pipeline. Either is loaded off the event loop and
+            # shared with every other reasoning instance.
+            try:
+                self.vllm_engine = await asyncio.to_thread(get_reasoning_vllm_engine)
+            except Exception as e:
+                logger.warning(f"vLLM reasoning engine unavailable: {e}")
+            
+            if self.vllm_engine is None:
+                self.generator = await asyncio.to_thread(get_reasoning_generator)
             
             logger.info("Reasoning engine models loaded successfully")
             
@@ -84,15 +216,19 @@ class ReasoningChainGenerator:
     async def _init_llm_clients(self):
         """Initialize LLM clients for advanced reasoning"""
         try:
+            # Async clients, so LLM requests are awaited instead of blocking
+            # the event loop and concurrent requests overlap
+            
             # Initialize OpenAI client if API key is available
             if os.getenv("OPENAI_API_KEY"):
-                openai.api_key = os.getenv("OPENAI_API_KEY")
-                self.openai_client = openai
+                self.openai_client = openai.AsyncOpenAI(
+                    api_key=os.getenv("OPENAI_API_KEY")
+                )
                 logger.info("OpenAI client initialized")
             
             # Initialize Anthropic client if API key is available
             if os.getenv("ANTHROPIC_API_KEY"):
-                self.anthropic_client = anthropic.Anthropic(
+                self.anthropic_client = anthropic.AsyncAnthropic(
                     api_key=os.getenv("ANTHROPIC_API_KEY")
                 )
                 logger.info("Anthropic client initialized")
@@ -100,9 +236,9 @@ class ReasoningChainGenerator:
         except Exception as e:
             logger.warning(f"LLM client initialization failed: {e}")
     
-    def _load_fallacy_patterns(self) -> Dict[LogicalFallacy, List[str]]:
-        """Load patterns for logical fallacy detection"""
-        return {
+    def _load_fallacy_patterns(self) -> Dict[LogicalFallacy, List[re.Pattern]]:
+        """Load compiled, case-insensitive patterns for logical fallacy detection"""
+        patterns = {
             LogicalFallacy.AD_HOMINEM: [
                 r"\b(you|they)\s+(are|is)\s+(stupid|wrong|biased|incompetent)",
                 r"\b(attack|dismiss|ignore)\s+the\s+(person|individual|source)"
@@ -124,6 +260,57 @@ class ReasoningChainGenerator:
                 r"\b(one|few|some)\s+.{10,}\s+(therefore|so)\s+(all|every)"
             ]
         }
+        
+        # Compiled once here instead of on every detection call; each pattern
+        # keeps its own scan since matches of different patterns may overlap
+        return {
+            fallacy: [re.compile(pattern, re.IGNORECASE) for pattern in fallacy_patterns]
+            for fallacy, fallacy_patterns in patterns.items()
+        }
+    
+    def _build_fallacy_database(self):
+        """Compile the fallacy patterns into one Hyperscan database, or None without hyperscan"""
+        if hyperscan is None:
+            return None
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[pattern.pattern.encode() for _, pattern in self.fallacy_pattern_list],
+                ids=list(range(len(self.fallacy_pattern_list))),
+                elements=len(self.fallacy_pattern_list),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(self.fallacy_pattern_list)
+            )
+            return database
+            
+        except Exception as e:
+            logger.warning(f"Hyperscan fallacy database unavailable: {e}")
+            return None
+    
+    def _matching_fallacy_patterns(self, text: str) -> Optional[Set[int]]:
+        """Indices of the fallacy patterns that match somewhere in text, or None to try them all"""
+        if self.fallacy_database is None or self.prefilter_unsafe_pattern.search(text):
+            return None
+        
+        matched = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            matched.add(pattern_id)
+        
+        self.fallacy_database.scan(text.encode(), match_event_handler=on_match)
+        return matched
+    
+    def _build_connecting_automaton(self):
+        """Build the Aho-Corasick automaton over the connecting words, or None without ahocorasick"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for word in self.connecting_words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        
+        return automaton
     
     async def generate_reasoning_chain(
         self,
@@ -135,12 +322,27 @@ class ReasoningChainGenerator:
         use_llm: bool = True
     ) -> ReasoningResponse:
         """Generate comprehensive reasoning chains with advanced analysis"""
+        await self._ensure_initialized()
         
         start_time = asyncio.get_event_loop().time()
         
         try:
+            # Identical LLM requests are answered from the response cache
+            llm_used = bool(use_llm and (self.openai_client or self.anthropic_client))
+            if llm_used:
+                cache_key = self._response_cache_key(
+                    claim, evidence, reasoning_type, complexity, max_steps
+                )
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    self.response_cache.move_to_end(cache_key)
+                    # Callers may modify the chains, so hand out a copy
+                    return cached.model_copy(deep=True, update={
+                        "processing_time": asyncio.get_event_loop().time() - start_time
+                    })
+            
             # Generate primary reasoning chain
-            if use_llm and (self.openai_client or self.anthropic_client):
+            if llm_used:
                 chains = await self._generate_llm_reasoning(
                     claim, evidence, reasoning_type, complexity, max_steps
                 )
@@ -149,26 +351,21 @@ class ReasoningChainGenerator:
                     claim, evidence, reasoning_type, max_steps
                 )
             
-            # Enhance chains with advanced analysis
-            for chain in chains:
-                # Detect logical fallacies
-                chain.fallacies = await self._detect_fallacies(chain)
-                
-                # Identify logical gaps
-                chain.logical_gaps = await self._identify_logical_gaps(chain, evidence)
-                
-                # Generate counterarguments
-                chain.counterarguments = await self._generate_counterarguments(claim, chain)
-                
-                # Assess premise-conclusion strength
-                chain.premise_strength = await self._assess_premise_strength(chain)
-                
-                # Identify evidence requirements
-                chain.evidence_requirements = await self._identify_evidence_requirements(chain)
+            # Enhance chains with advanced analysis, all chains concurrently,
+            # while one LLM request covers every chain's counterarguments
+            counterarguments, _ = await asyncio.gather(
+                self._generate_counterarguments_bulk(claim, chains),
+                asyncio.gather(*(self._enhance_chain(chain, evidence) for chain in chains))
+            )
+            counterarguments_failed = counterarguments is None
+            if counterarguments_failed:
+                counterarguments = [[] for _ in chains]
+            for chain, chain_counterarguments in zip(chains, counterarguments):
+                chain.counterarguments = chain_counterarguments
             
             processing_time = asyncio.get_event_loop().time() - start_time
             
-            return ReasoningResponse(
+            response = ReasoningResponse(
                 reasoning_chains=chains,
                 processing_time=processing_time,
                 model_version="reasoning-chain-generator-v2.0",
@@ -181,10 +378,48 @@ class ReasoningChainGenerator:
                 }
             )
             
+            # Failed LLM calls yield no chains or counterarguments and are retried next time
+            if (llm_used and chains and not counterarguments_failed
+                    and self.response_cache_size > 0):
+                self.response_cache[cache_key] = response.model_copy(deep=True)
+                if len(self.response_cache) > self.response_cache_size:
+                    self.response_cache.popitem(last=False)
+            
+            return response
+            
         except Exception as e:
             logger.error(f"Reasoning chain generation failed: {e}")
             raise
     
+    def _response_cache_key(
+        self,
+        claim: str,
+        evidence: List[str],
+        reasoning_type: ReasoningType,
+        complexity: ReasoningComplexity,
+        max_steps: int
+    ) -> str:
+        """Stable digest of a reasoning request; evidence order does not matter"""
+        request = json.dumps(
+            [claim, sorted(evidence), reasoning_type.value, complexity.value, max_steps],
+            sort_keys=True
+        )
+        return hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+    
+    async def _enhance_chain(self, chain: ReasoningChain, evidence: List[str]):
+        """Add fallacies, gaps, premise strength and evidence requirements to a chain"""
+        (
+            chain.fallacies,
+            chain.logical_gaps,
+            chain.premise_strength,
+            chain.evidence_requirements
+        ) = await asyncio.gather(
+            self._detect_fallacies(chain),
+            self._identify_logical_gaps(chain, evidence),
+            self._assess_premise_strength(chain),
+            self._identify_evidence_requirements(chain)
+        )
+    
     async def _generate_llm_reasoning(
         self,
         claim: str,
@@ -226,22 +461,31 @@ class ReasoningChainGenerator:
     ) -> List[ReasoningChain]:
         """Generate reasoning using Anthropic Claude"""
         
-        prompt = self._build_advanced_prompt(
-            claim, evidence, reasoning_type, complexity, max_steps
-        )
+        instructions = self.instruction_prompts[(reasoning_type, complexity)]
+        prompt = self._build_advanced_prompt(claim, evidence, max_steps)
         
         try:
-            response = self.anthropic_client.messages.create(
+            # Stream the completion so steps are parsed while it decodes
+            parser = StepStreamParser(self.step_pattern)
+            async with self.anthropic_client.messages.stream(
                 model="claude-3-sonnet-20240229",
                 max_tokens=2000,
                 temperature=0.3,
+                # Mark the static instructions as a cached prompt prefix. This
+                # is inert for now: the block is below the minimum cacheable
+                # length, and claude-3-sonnet-20240229 does not support caching.
+                system=[
+                    {"type": "text", "text": instructions, "cache_control": {"type": "ephemeral"}}
+                ],
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
-            )
+            ) as stream:
+                async for text in stream.text_stream:
+                    parser.feed(text)
+            parser.close()
             
-            reasoning_text = response.content[0].text
-            return await self._parse_structured_reasoning(reasoning_text, reasoning_type)
+            return await self._parse_structured_reasoning(parser.text, reasoning_type, parser.steps)
             
         except Exception as e:
             logger.error(f"Anthropic reasoning failed: {e}")
@@ -257,39 +501,41 @@ class ReasoningChainGenerator:
     ) -> List[ReasoningChain]:
         """Generate reasoning using OpenAI GPT"""
         
-        prompt = self._build_advanced_prompt(
-            claim, evidence, reasoning_type, complexity, max_steps
-        )
+        instructions = self.instruction_prompts[(reasoning_type, complexity)]
+        prompt = self._build_advanced_prompt(claim, evidence, max_steps)
         
         try:
-            response = await openai.ChatCompletion.acreate(
+            # Stream the completion so steps are parsed while it decodes
+            parser = StepStreamParser(self.step_pattern)
+            stream = await self.openai_client.chat.completions.create(
                 model="gpt-4",
+                # The static instructions lead, so automatic prefix caching can
+                # hit once the prefix exceeds its 1024-token minimum
                 messages=[
-                    {"role": "system", "content": "You are an expert logician and critical thinking assistant."},
+                    {"role": "system", "content": instructions},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=2000
+                max_tokens=2000,
+                stream=True
             )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parser.feed(chunk.choices[0].delta.content)
+            parser.close()
             
-            reasoning_text = response.choices[0].message.content
-            return await self._parse_structured_reasoning(reasoning_text, reasoning_type)
+            return await self._parse_structured_reasoning(parser.text, reasoning_type, parser.steps)
             
         except Exception as e:
             logger.error(f"OpenAI reasoning failed: {e}")
             return []
     
-    def _build_advanced_prompt(
+    def _build_instruction_prompt(
         self,
-        claim: str,
-        evidence: List[str],
         reasoning_type: ReasoningType,
-        complexity: ReasoningComplexity,
-        max_steps: int
+        complexity: ReasoningComplexity
     ) -> str:
-        """Build advanced chain-of-thought reasoning prompt"""
-        
-        evidence_text = "\n".join([f"- {ev}" for ev in evidence]) if evidence else "No specific evidence provided"
+        """Build the static chain-of-thought instructions for a reasoning type and complexity"""
         
         complexity_instructions = {
             ReasoningComplexity.BASIC: "Use simple, clear logical steps that are easy to follow.",
@@ -304,13 +550,9 @@ class ReasoningChainGenerator:
             ReasoningType.ABDUCTIVE: "Use abductive reasoning: find the best explanation for the given observations."
         }
         
-        return f"""
-Analyze the following claim using {reasoning_type.value} reasoning at {complexity.value} level:
+        return f"""You are an expert logician and critical thinking assistant.
 
-CLAIM: {claim}
-
-EVIDENCE:
-{evidence_text}
+Analyze the claim you are given using {reasoning_type.value} reasoning at {complexity.value} level.
 
 INSTRUCTIONS:
 {reasoning_instructions[reasoning_type]}
@@ -334,6 +576,23 @@ EVIDENCE REQUIREMENTS:
 
 COUNTERARGUMENTS:
 - What are the strongest arguments against this reasoning?
+"""
+    
+    def _build_advanced_prompt(
+        self,
+        claim: str,
+        evidence: List[str],
+        max_steps: int
+    ) -> str:
+        """Build the per-request part of the chain-of-thought prompt"""
+        
+        evidence_text = "\n".join([f"- {ev}" for ev in evidence]) if evidence else "No specific evidence provided"
+        
+        return f"""
+CLAIM: {claim}
+
+EVIDENCE:
+{evidence_text}
 
 Limit to {max_steps} main reasoning steps.
 """
@@ -341,57 +600,44 @@ Limit to {max_steps} main reasoning steps.
     async def _parse_structured_reasoning(
         self, 
         reasoning_text: str, 
-        reasoning_type: ReasoningType
+        reasoning_type: ReasoningType,
+        steps: Optional[List[ReasoningStep]] = None
     ) -> List[ReasoningChain]:
         """Parse structured reasoning response into ReasoningChain objects"""
         
         try:
-            steps = []
             assumptions = []
             weaknesses = []
             evidence_requirements = []
             counterarguments = []
             
-            # Parse reasoning steps
-            step_pattern = r"Step\s+(\d+):\s*\[([^\]]+)\]\s*-\s*(.+)"
-            step_matches = re.findall(step_pattern, reasoning_text, re.IGNORECASE | re.MULTILINE)
-            
-            for step_num, step_type, explanation in step_matches:
-                step = ReasoningStep(
-                    step_number=int(step_num),
-                    text=explanation.strip(),
-                    confidence=0.8,  # Default, could be enhanced with confidence detection
-                    type=step_type.lower().replace(" ", "_"),
-                    evidence_used=[]
-                )
-                steps.append(step)
+            # Parse reasoning steps, unless they were parsed while streaming
+            if steps is None:
+                parser = StepStreamParser(self.step_pattern)
+                parser.feed(reasoning_text)
+                parser.close()
+                steps = parser.steps
+            
+            sections = self._split_sections(reasoning_text)
             
             # Parse assumptions
-            assumptions_section = re.search(r"ASSUMPTIONS:(.*?)(?=\n[A-Z]+:|$)", reasoning_text, re.DOTALL | re.IGNORECASE)
-            if assumptions_section:
-                assumption_lines = [line.strip('- ').strip() for line in assumptions_section.group(1).split('\n') if line.strip()]
-                assumptions = [line for line in assumption_lines if line and not line.startswith('ASSUMPTIONS')]
+            if "ASSUMPTIONS" in sections:
+                assumptions = self._section_items(sections["ASSUMPTIONS"], 'ASSUMPTIONS')
             
             # Parse weaknesses
-            weaknesses_section = re.search(r"POTENTIAL WEAKNESSES:(.*?)(?=\n[A-Z]+:|$)", reasoning_text, re.DOTALL | re.IGNORECASE)
-            if weaknesses_section:
-                weakness_lines = [line.strip('- ').strip() for line in weaknesses_section.group(1).split('\n') if line.strip()]
-                weaknesses = [line for line in weakness_lines if line and not line.startswith('POTENTIAL')]
+            if "POTENTIAL WEAKNESSES" in sections:
+                weaknesses = self._section_items(sections["POTENTIAL WEAKNESSES"], 'POTENTIAL')
             
             # Parse evidence requirements
-            evidence_section = re.search(r"EVIDENCE REQUIREMENTS:(.*?)(?=\n[A-Z]+:|$)", reasoning_text, re.DOTALL | re.IGNORECASE)
-            if evidence_section:
-                evidence_lines = [line.strip('- ').strip() for line in evidence_section.group(1).split('\n') if line.strip()]
-                evidence_requirements = [line for line in evidence_lines if line and not line.startswith('EVIDENCE')]
+            if "EVIDENCE REQUIREMENTS" in sections:
+                evidence_requirements = self._section_items(sections["EVIDENCE REQUIREMENTS"], 'EVIDENCE')
             
             # Parse counterarguments
-            counter_section = re.search(r"COUNTERARGUMENTS:(.*?)(?=\n[A-Z]+:|$)", reasoning_text, re.DOTALL | re.IGNORECASE)
-            if counter_section:
-                counter_lines = [line.strip('- ').strip() for line in counter_section.group(1).split('\n') if line.strip()]
-                counterarguments = [line for line in counter_lines if line and not line.startswith('COUNTER')]
+            if "COUNTERARGUMENTS" in sections:
+                counterarguments = self._section_items(sections["COUNTERARGUMENTS"], 'COUNTER')
             
             # Calculate overall confidence and validity
-            overall_confidence = sum(step.confidence for step in steps) / len(steps) if steps else 0.0
+            overall_confidence = self._mean_confidence(steps)
             logical_validity = await self._assess_logical_validity(steps, reasoning_type)
             
             chain = ReasoningChain(
@@ -413,25 +659,62 @@ Limit to {max_steps} main reasoning steps.
             logger.error(f"Structured reasoning parsing failed: {e}")
             return []
     
+    def _split_sections(self, reasoning_text: str) -> Dict[str, str]:
+        """Map each section of a structured response to the text after its first header"""
+        sections = {}
+        
+        for match in self.section_header_pattern.finditer(reasoning_text):
+            section = self.sections[match.lastindex - 1]
+            if section in sections:
+                continue
+            
+            end = self.section_end_pattern.search(reasoning_text, match.end())
+            sections[section] = reasoning_text[match.end():end.start() if end else len(reasoning_text)]
+            if len(sections) == len(self.sections):
+                break
+        
+        return sections
+    
+    def _section_items(self, section_text: str, header_prefix: str) -> List[str]:
+        """Strip the bullets of a section's lines, skipping blanks and header lines"""
+        lines = [line.strip('- ').strip() for line in section_text.split('\n') if line.strip()]
+        return [line for line in lines if line and not line.startswith(header_prefix)]
+    
     async def _detect_fallacies(self, chain: ReasoningChain) -> List[Dict[str, Union[str, float]]]:
         """Detect logical fallacies in reasoning chain"""
         
-        fallacies_detected = []
-        
         # Combine all step texts for analysis
         full_text = " ".join([step.text for step in chain.steps])
         
-        for fallacy, patterns in self.fallacy_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, full_text, re.IGNORECASE)
-                for match in matches:
-                    fallacies_detected.append({
-                        "type": fallacy.value,
-                        "description": self._get_fallacy_description(fallacy),
-                        "confidence": 0.7,
-                        "location": match.span(),
-                        "text_excerpt": match.group()
-                    })
+        if full_text in self.fallacy_cache:
+            self.fallacy_cache.move_to_end(full_text)
+        else:
+            self.fallacy_cache[full_text] = self._scan_fallacies(full_text)
+            if len(self.fallacy_cache) > self.fallacy_cache_size:
+                self.fallacy_cache.popitem(last=False)
+        
+        # Callers store the results on their chain, so hand out copies
+        return [dict(fallacy) for fallacy in self.fallacy_cache[full_text]]
+    
+    def _scan_fallacies(self, full_text: str) -> List[Dict[str, Union[str, float]]]:
+        """Match the fallacy patterns against a chain's combined text"""
+        fallacies_detected = []
+        
+        # Only patterns the prefilter found are scanned for their matches
+        candidates = self._matching_fallacy_patterns(full_text)
+        
+        for index, (fallacy, pattern) in enumerate(self.fallacy_pattern_list):
+            if candidates is not None and index not in candidates:
+                continue
+            
+            for match in pattern.finditer(full_text):
+                fallacies_detected.append({
+                    "type": fallacy.value,
+                    "description": self._get_fallacy_description(fallacy),
+                    "confidence": 0.7,
+                    "location": match.span(),
+                    "text_excerpt": match.group()
+                })
         
         return fallacies_detected
     
@@ -493,10 +776,11 @@ Limit to {max_steps} main reasoning steps.
     def _steps_logically_connected(self, step1: ReasoningStep, step2: ReasoningStep) -> bool:
         """Check if two reasoning steps are logically connected"""
         # Simple heuristic: look for connecting words or shared concepts
-        connecting_words = ["therefore", "thus", "hence", "because", "since", "given that", "it follows"]
-        
         step2_lower = step2.text.lower()
-        return any(word in step2_lower for word in connecting_words)
+        
+        if self.connecting_automaton is not None:
+            return next(self.connecting_automaton.iter(step2_lower), None) is not None
+        return any(word in step2_lower for word in self.connecting_words)
     
     async def _generate_counterarguments(
         self, 
@@ -504,6 +788,7 @@ Limit to {max_steps} main reasoning steps.
         chain: ReasoningChain
     ) -> List[str]:
         """Generate counterarguments to the reasoning chain"""
+        await self._ensure_initialized()
         
         if not (self.openai_client or self.anthropic_client):
             return ["Counterargument generation requires LLM access"]
@@ -525,33 +810,113 @@ Format as a simple list of counterarguments.
 """
             
             if self.anthropic_client:
-                response = self.anthropic_client.messages.create(
+                response = await self.anthropic_client.messages.create(
                     model="claude-3-sonnet-20240229",
                     max_tokens=800,
                     messages=[{"role": "user", "content": prompt}]
                 )
                 counterarguments_text = response.content[0].text
             else:
-                response = await openai.ChatCompletion.acreate(
+                response = await self.openai_client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=[{"role": "user", "content": prompt}],
                     max_tokens=800
                 )
                 counterarguments_text = response.choices[0].message.content
             
-            # Parse counterarguments
-            counterarguments = [
-                line.strip('- ').strip() 
-                for line in counterarguments_text.split('\n') 
-                if line.strip() and line.strip().startswith(('-', '•', str))
-            ]
-            
-            return counterarguments[:3]  # Limit to 3 counterarguments
+            return self._parse_counterarguments(counterarguments_text)
             
         except Exception as e:
             logger.error(f"Counterargument generation failed: {e}")
             return []
     
+    async def _generate_counterarguments_bulk(
+        self, 
+        claim: str, 
+        chains: List[ReasoningChain]
+    ) -> Optional[List[List[str]]]:
+        """Generate counterarguments for every reasoning chain with a single LLM request, or None if it fails"""
+        
+        if not chains:
+            return []
+        
+        if not (self.openai_client or self.anthropic_client):
+            return [["Counterargument generation requires LLM access"] for _ in chains]
+        
+        try:
+            chains_text = "\n\n".join(
+                f"CHAIN_{index}:\n{self._format_chain_for_prompt(chain)}"
+                for index, chain in enumerate(chains, 1)
+            )
+            prompt = f"""
+Given the claim: "{claim}"
+
+And the following reasoning chains:
+{chains_text}
+
+For each chain, generate 2-3 strong counterarguments that challenge its reasoning. Focus on:
+1. Alternative explanations
+2. Contradictory evidence
+3. Logical weaknesses
+4. Different interpretations
+
+Respond with only a JSON object mapping each chain to its counterarguments, e.g.
+{{"chain_1": ["counterargument", "counterargument"], "chain_2": ["counterargument"]}}
+"""
+            
+            if self.anthropic_client:
+                response = await self.anthropic_client.messages.create(
+                    model="claude-3-sonnet-20240229",
+                    max_tokens=800 * len(chains),
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                counterarguments_text = response.content[0].text
+            else:
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=800 * len(chains),
+                    response_format={"type": "json_object"}
+                )
+                counterarguments_text = response.choices[0].message.content
+            
+            return self._parse_bulk_counterarguments(counterarguments_text, len(chains))
+            
+        except Exception as e:
+            logger.error(f"Bulk counterargument generation failed: {e}")
+            return None
+    
+    def _parse_bulk_counterarguments(self, counterarguments_text: str, chain_count: int) -> List[List[str]]:
+        """Slice a {"chain_i": [...]} counterargument response back to its chains"""
+        # Tolerate prose or code fences around the JSON object
+        start = counterarguments_text.find("{")
+        end = counterarguments_text.rfind("}")
+        parsed = json.loads(counterarguments_text[start:end + 1]) if start != -1 else {}
+        
+        counterarguments = []
+        for index in range(1, chain_count + 1):
+            chain_counterarguments = parsed.get(f"chain_{index}", [])
+            if not isinstance(chain_counterarguments, list):
+                chain_counterarguments = []
+            
+            counterarguments.append([
+                str(counterargument).strip()
+                for counterargument in chain_counterarguments
+                if str(counterargument).strip()
+            ][:3])  # Limit to 3 counterarguments
+        
+        return counterarguments
+    
+    def _parse_counterarguments(self, counterarguments_text: str) -> List[str]:
+        """Parse the bulleted or numbered counterarguments of a list response"""
+        counterarguments = [
+            match.group(1).strip()
+            for line in counterarguments_text.splitlines()
+            if (match := self.bullet_pattern.match(line))
+        ]
+        
+        return counterarguments[:3]  # Limit to 3 counterarguments
+    
     def _format_chain_for_prompt(self, chain: ReasoningChain) -> str:
         """Format reasoning chain for LLM prompt"""
         formatted_steps = []
@@ -568,17 +933,14 @@ Format as a simple list of counterarguments.
             return {"overall_strength": 0.0, "premise_count": 0}
         
         # Simple strength assessment based on confidence and evidence
-        total_strength = 0.0
-        for step in premise_steps:
-            strength = step.confidence
-            if step.evidence_used:
-                strength += 0.2  # Bonus for evidence-backed premises
-            total_strength += min(strength, 1.0)
-        
-        average_strength = total_strength / len(premise_steps)
+        confidences = self._confidences(premise_steps)
+        has_evidence = np.fromiter(
+            (bool(step.evidence_used) for step in premise_steps), dtype=np.float64, count=len(premise_steps)
+        )
+        strengths = np.minimum(confidences + 0.2 * has_evidence, 1.0)  # Bonus for evidence-backed premises
         
         return {
-            "overall_strength": average_strength,
+            "overall_strength": float(strengths.mean()),
             "premise_count": len(premise_steps),
             "individual_strengths": [
                 {"step": step.step_number, "strength": step.confidence}
@@ -586,28 +948,43 @@ Format as a simple list of counterarguments.
             ]
         }
     
+    def _confidences(self, steps: List[ReasoningStep]) -> np.ndarray:
+        """Step confidences as an array, extracted once for vectorized reductions"""
+        return np.fromiter((step.confidence for step in steps), dtype=np.float64, count=len(steps))
+    
+    def _mean_confidence(self, steps: List[ReasoningStep]) -> float:
+        """Mean step confidence, 0.0 for no steps"""
+        return float(self._confidences(steps).mean()) if steps else 0.0
+    
     async def _identify_evidence_requirements(self, chain: ReasoningChain) -> List[str]:
         """Identify what evidence would strengthen the reasoning chain"""
         
-        requirements = []
-        
         # Check for unsupported premises
-        for step in chain.steps:
-            if step.type == "premise" and not step.evidence_used:
-                requirements.append(f"Evidence to support: {step.text[:50]}...")
+        premise_requirements = (
+            f"Evidence to support: {step.text[:50]}..."
+            for step in chain.steps
+            if step.type == "premise" and not step.evidence_used
+        )
         
         # Check for weak inferences
-        weak_steps = [step for step in chain.steps if step.confidence < 0.6]
-        for step in weak_steps:
-            requirements.append(f"Additional support needed for: {step.text[:50]}...")
+        weak_step_requirements = (
+            f"Additional support needed for: {step.text[:50]}..."
+            for step in chain.steps
+            if step.confidence < 0.6
+        )
         
         # Generic requirements based on reasoning type
-        if chain.reasoning_type == ReasoningType.INDUCTIVE:
-            requirements.append("More examples or cases to strengthen generalization")
-        elif chain.reasoning_type == ReasoningType.ABDUCTIVE:
-            requirements.append("Evidence ruling out alternative explanations")
+        type_requirements = {
+            ReasoningType.INDUCTIVE: ("More examples or cases to strengthen generalization",),
+            ReasoningType.ABDUCTIVE: ("Evidence ruling out alternative explanations",)
+        }.get(chain.reasoning_type, ())
         
-        return requirements[:5]  # Limit to 5 requirements
+        # Requirements are built lazily, so steps past the cap are never
+        # formatted or even visited
+        return list(itertools.islice(
+            itertools.chain(premise_requirements, weak_step_requirements, type_requirements),
+            5  # Limit to 5 requirements
+        ))
     
     # Legacy method for backward compatibility
     async def generate_reasoning(
@@ -665,7 +1042,7 @@ Format as a simple list of counterarguments.
             steps = await self._generate_reasoning_steps(prompt, max_steps, "deductive")
             
             # Calculate overall confidence and validity
-            overall_confidence = sum(step.confidence for step in steps) / len(steps) if steps else 0.0
+            overall_confidence = self._mean_confidence(steps)
             logical_validity = await self._assess_logical_validity(steps, ReasoningType.DEDUCTIVE)
             
             chain = ReasoningChain(
@@ -696,7 +1073,7 @@ Format as a simple list of counterarguments.
             steps = await self._generate_reasoning_steps(prompt, max_steps, "inductive")
             
             # Calculate overall confidence and validity
-            overall_confidence = sum(step.confidence for step in steps) / len(steps) if steps else 0.0
+            overall_confidence = self._mean_confidence(steps)
             logical_validity = await self._assess_logical_validity(steps, ReasoningType.INDUCTIVE)
             
             chain = ReasoningChain(
@@ -727,7 +1104,7 @@ Format as a simple list of counterarguments.
             steps = await self._generate_reasoning_steps(prompt, max_steps, "abductive")
             
             # Calculate overall confidence and validity
-            overall_confidence = sum(step.confidence for step in steps) / len(steps) if steps else 0.0
+            overall_confidence = self._mean_confidence(steps)
             logical_validity = await self._assess_logical_validity(steps, ReasoningType.ABDUCTIVE)
             
             chain = ReasoningChain(
@@ -799,13 +1176,16 @@ Format your response as numbered steps:
     ) -> List[ReasoningStep]:
         """Generate individual reasoning steps"""
         try:
-            if not self.generator:
+            if self.vllm_engine is not None:
+                # vLLM returns only the continuation; the pipeline includes the prompt
+                generated_text = prompt + await self._generate_with_vllm(prompt)
+            elif self.generator:
+                # Generate text
+                generated = self.generator(prompt, max_length=len(prompt) + 200, num_return_sequences=1)
+                generated_text = generated[0]['generated_text']
+            else:
                 return []
             
-            # Generate text
-            generated = self.generator(prompt, max_length=len(prompt) + 200, num_return_sequences=1)
-            generated_text = generated[0]['generated_text']
-            
             # Parse generated text into steps
             steps = self._parse_reasoning_steps(generated_text, reasoning_type)
             
@@ -815,6 +1195,16 @@ Format your response as numbered steps:
             logger.error(f"Reasoning step generation failed: {e}")
             return []
     
+    async def _generate_with_vllm(self, prompt: str) -> str:
+        """Generate a continuation on the shared vLLM engine, batched with concurrent requests"""
+        sampling_params = SamplingParams(temperature=0.7, max_tokens=200)
+        
+        final_output = None
+        async for output in self.vllm_engine.generate(prompt, sampling_params, request_id=uuid.uuid4().hex):
+            final_output = output
+        
+        return final_output.outputs[0].text if final_output else ""
+    
     def _parse_reasoning_steps(self, generated_text: str, reasoning_type: str) -> List[ReasoningStep]:
         """Parse generated text into structured reasoning steps"""
         try:
@@ -889,7 +1279,7 @@ Format your response as numbered steps:
                 validity_score += 0.3
             
             # Check confidence levels
-            avg_confidence = sum(step.confidence for step in steps) / len(steps)
+            avg_confidence = self._mean_confidence(steps)
             validity_score += avg_confidence * 0.2
             
             return min(validity_score, 1.0)
@@ -0,0 +1,80 @@
+"""
+Shared model instances reused across ML services
+"""
+
+from functools import lru_cache
+import os
+import torch
+from transformers import pipeline
+from loguru import logger
+
+# vLLM serving of the reasoning generator is optional
+try:
+    from vllm import AsyncEngineArgs, AsyncLLMEngine
+except ImportError:
+    AsyncLLMEngine = None
+
+
+def inference_device() -> int:
+    """Return the pipeline device index: the first GPU when available, otherwise CPU (-1)"""
+    return 0 if torch.cuda.is_available() else -1
+
+
+@lru_cache(maxsize=None)
+def get_mnli_classifier(device: int = -1):
+    """Load the BART-MNLI classification pipeline once per device and share it between services"""
+    logger.info("Loading shared MNLI classifier...")
+
+    return pipeline(
+        "text-classification",
+        model="facebook/bart-large-mnli",
+        return_all_scores=True,
+        use_fast=True,
+        device=device
+    )
+
+
+@lru_cache(maxsize=None)
+def get_reasoning_generator():
+    """Load the DialoGPT text-generation pipeline once and share it between reasoning services"""
+    logger.info("Loading shared reasoning generator...")
+
+    # Half precision on GPU halves the weight bytes moved per decoded token.
+    # BF16 on CPU only pays off with native BF16 support (AVX512-BF16/AMX),
+    # so it is opt-in there.
+    device = inference_device()
+    if device >= 0:
+        torch_dtype = torch.float16
+    elif os.getenv("REASONING_GENERATOR_BF16", "0") == "1":
+        torch_dtype = torch.bfloat16
+    else:
+        torch_dtype = torch.float32
+
+    return pipeline(
+        "text-generation",
+        model="microsoft/DialoGPT-medium",
+        tokenizer="microsoft/DialoGPT-medium",
+        max_length=512,
+        do_sample=True,
+        temperature=0.7,
+        pad_token_id=50256,
+        device=device,
+        torch_dtype=torch_dtype
+    )
+
+
+@lru_cache(maxsize=None)
+def get_reasoning_vllm_engine():
+    """Start the shared vLLM engine for the reasoning generator, or None when disabled or unavailable"""
+    # vLLM needs a GPU and reserves its paged KV cache up front, so it is
+    # opt-in and only claims part of the device next to the other models
+    if AsyncLLMEngine is None or os.getenv("REASONING_USE_VLLM", "0") != "1" or inference_device() < 0:
+        return None
+
+    logger.info("Starting shared vLLM reasoning engine...")
+
+    return AsyncLLMEngine.from_engine_args(AsyncEngineArgs(
+        model="microsoft/DialoGPT-medium",
+        max_num_seqs=64,
+        gpu_memory_utilization=float(os.getenv("REASONING_VLLM_GPU_MEMORY", "0.3"))
+    ))
@@ -262,6 +262,30 @@ async def test_evidence_requirements():
         return False
 
 
+async def test_counterargument_parsing():
+    """Test counterargument parsing of bulleted and numbered lists"""
+    generator = ReasoningChainGenerator()
+    
+    counterarguments_text = """Here are the strongest counterarguments:
+- Correlation does not imply causation
+• Other factors explain the warming trend
+
+3) The observation period is too short
+4. A fourth counterargument is dropped"""
+    
+    # Parsing errors must surface here rather than yield an empty list
+    counterarguments = generator._parse_counterarguments(counterarguments_text)
+    
+    assert counterarguments == [
+        "Correlation does not imply causation",
+        "Other factors explain the warming trend",
+        "The observation period is too short"
+    ]
+    
+    print("✓ Counterargument parsing test passed")
+    return True
+
+
 async def run_all_tests():
     """Run all tests"""
     print("Running Advanced Reasoning Chain Generator Tests")
@@ -272,7 +296,8 @@ async def run_all_tests():
         test_fallacy_detection,
         test_logical_gap_identification,
         test_premise_strength_assessment,
-        test_evidence_requirements
+        test_evidence_requirements,
+        test_counterargument_parsing
     ]
     
     results = []
@@ -116,6 +116,21 @@ class TestClaimExtractor:
         
         assert confidence == 0.3
 
+    @pytest.mark.asyncio
+    async def test_classify_claims_batched(self, claim_extractor):
+        """Test that all sentences are classified in one call, scores in input order."""
+        # Score each input by its length, so the length sort is observable
+        claim_extractor.claim_classifier.side_effect = lambda inputs, batch_size: [
+            [{'label': 'ENTAILMENT', 'score': len(text) / 1000}] for text in inputs
+        ]
+        sentences = ["This considerably longer sentence comes first.", "A short one."]
+
+        confidences = await claim_extractor._classify_claims(sentences)
+
+        claim_extractor.claim_classifier.assert_called_once()
+        assert len(confidences) == 2
+        assert confidences[0] > confidences[1]
+
     @pytest.mark.asyncio
     async def test_classify_claim_type_assertion(self, claim_extractor):
         """Test classification of assertion type claims."""
@@ -143,6 +158,15 @@ class TestClaimExtractor:
         
         assert claim_type == ClaimType.HYPOTHESIS
 
+    @pytest.mark.asyncio
+    async def test_classify_claim_type_matches_whole_words(self, claim_extractor):
+        """Test that question cues are not matched inside other words."""
+        assertion_text = "Studies show that emissions rose somewhat, however slowly."
+        
+        claim_type = await claim_extractor._classify_claim_type(assertion_text)
+        
+        assert claim_type == ClaimType.ASSERTION
+
     @pytest.mark.asyncio
     async def test_extract_keywords(self, claim_extractor):
         """Test keyword extraction from text."""
@@ -284,13 +308,10 @@ class TestClaimExtractor:
         claim_extractor._find_related_evidence = AsyncMock(return_value=[])
 
         # Mock classification - first sentence high confidence, second low
-        async def mock_classify_claim(sentence):
-            if "climate change" in sentence.lower():
-                return 0.9
-            else:
-                return 0.4
+        async def mock_classify_claims(sentences):
+            return [0.9 if "climate change" in sentence.lower() else 0.4 for sentence in sentences]
 
-        claim_extractor._classify_claim = mock_classify_claim
+        claim_extractor._classify_claims = mock_classify_claims
         claim_extractor._classify_claim_type = AsyncMock(return_value=ClaimType.ASSERTION)
 
         # Test with high threshold
@@ -313,7 +334,7 @@ class TestClaimExtractor:
         claim_extractor.nlp.return_value = mock_doc
         
         # Mock other methods
-        claim_extractor._classify_claim = AsyncMock(return_value=0.8)
+        claim_extractor._classify_claims = AsyncMock(side_effect=lambda sentences: [0.8] * len(sentences))
         claim_extractor._classify_claim_type = AsyncMock(return_value=ClaimType.ASSERTION)
         claim_extractor._extract_keywords = AsyncMock(return_value=['solar', 'power'])
 
@@ -358,7 +379,7 @@ class TestClaimExtractor:
         mock_doc.sents = [mock_sent]
         claim_extractor.nlp.return_value = mock_doc
         
-        claim_extractor._classify_claim = AsyncMock(return_value=0.8)
+        claim_extractor._classify_claims = AsyncMock(side_effect=lambda sentences: [0.8] * len(sentences))
         claim_extractor._classify_claim_type = AsyncMock(return_value=ClaimType.ASSERTION)
         claim_extractor._extract_keywords = AsyncMock(return_value=['climate'])
         claim_extractor._find_related_evidence = AsyncMock(return_value=[])
@@ -422,7 +443,7 @@ class TestClaimExtractor:
         claim_extractor.nlp.return_value = mock_doc
         
         # Mock classification to accept all (for testing filtering)
-        claim_extractor._classify_claim = AsyncMock(return_value=0.8)
+        claim_extractor._classify_claims = AsyncMock(side_effect=lambda sentences: [0.8] * len(sentences))
         claim_extractor._classify_claim_type = AsyncMock(return_value=ClaimType.ASSERTION)
         claim_extractor._extract_keywords = AsyncMock(return_value=['test'])
         claim_extractor._find_related_evidence = AsyncMock(return_value=[])
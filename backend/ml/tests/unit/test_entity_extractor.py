@@ -0,0 +1,109 @@
+"""
+Unit tests for the EntityExtractor request batchers.
+"""
+import pytest
+import pytest_asyncio
+import asyncio
+
+from services.entity_extractor import EntityExtractor
+
+
+@pytest.mark.unit
+class TestEntityBatcher:
+    """Test cases for coalescing single-text requests into batched calls."""
+
+    @pytest_asyncio.fixture
+    async def entity_extractor(self):
+        """Create EntityExtractor instance with a short batching window."""
+        extractor = EntityExtractor()
+        extractor.max_batch_size = 4
+        extractor.max_batch_delay = 0.05
+        yield extractor
+
+        # Stop the batchers before the test's event loop closes
+        tasks = [task for _, _, task in extractor._batchers.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @pytest.fixture
+    def batch_calls(self):
+        """Record the texts of every batch_fn call."""
+        return []
+
+    @pytest.fixture
+    def batch_fn(self, batch_calls):
+        """Fake batch function upper-casing each text."""
+        def upper(texts):
+            batch_calls.append(list(texts))
+            return [text.upper() for text in texts]
+        return upper
+
+    @pytest.mark.asyncio
+    async def test_requests_coalesced_up_to_max_batch_size(self, entity_extractor, batch_fn, batch_calls):
+        """Test that concurrent requests are batched, at most max_batch_size at a time."""
+        queue = entity_extractor._start_batcher(batch_fn)
+        texts = [f"text {i}" for i in range(6)]
+
+        results = await asyncio.gather(
+            *(entity_extractor._submit_to_batcher(queue, text) for text in texts)
+        )
+
+        assert results == [text.upper() for text in texts]
+        assert [len(batch) for batch in batch_calls] == [4, 2]
+
+    @pytest.mark.asyncio
+    async def test_batch_exception_reaches_every_caller(self, entity_extractor):
+        """Test that a failing batch raises its exception in every caller."""
+        def failing(texts):
+            raise ValueError("inference failed")
+
+        queue = entity_extractor._start_batcher(failing)
+
+        results = await asyncio.gather(
+            *(entity_extractor._submit_to_batcher(queue, f"text {i}") for i in range(3)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+        # The batcher keeps serving after a failed batch
+        assert not entity_extractor._batchers[queue][2].done()
+
+    @pytest.mark.asyncio
+    async def test_batcher_restarted_after_task_dies(self, entity_extractor, batch_fn):
+        """Test that a request after the batcher task ended restarts it."""
+        queue = entity_extractor._start_batcher(batch_fn)
+        task = entity_extractor._batchers[queue][2]
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        result = await entity_extractor._submit_to_batcher(queue, "after restart")
+
+        assert result == "AFTER RESTART"
+        assert entity_extractor._batchers[queue][2] is not task
+
+    @pytest.mark.asyncio
+    async def test_queued_requests_fail_when_batcher_stops(self, entity_extractor, batch_fn):
+        """Test that requests still queued when the batcher stops fail instead of hanging."""
+        queue = entity_extractor._start_batcher(batch_fn)
+        future = asyncio.get_running_loop().create_future()
+        await queue.put(("queued", future))
+        entity_extractor._batchers[queue][2].cancel()
+
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(future, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_request_from_another_loop_runs_directly(self, entity_extractor, batch_fn, batch_calls):
+        """Test that a request from another event loop bypasses the queue."""
+        queue = entity_extractor._start_batcher(batch_fn)
+
+        result = await asyncio.to_thread(
+            asyncio.run, entity_extractor._submit_to_batcher(queue, "other loop")
+        )
+
+        assert result == "OTHER LOOP"
+        assert batch_calls == [["other loop"]]
+        assert queue.empty()
@@ -0,0 +1,51 @@
+"""
+Unit tests for the QualityScorer issue and recommendation rules.
+"""
+import pytest
+import numpy as np
+
+from services.quality_scorer import (
+    ISSUE_RULES,
+    RECOMMENDATION_RULES,
+    NO_MESSAGES,
+    _quality_issues,
+    _quality_recommendations,
+)
+
+
+@pytest.mark.unit
+class TestScoreRules:
+    """Test cases for the threshold rules over QualityMetrics scores."""
+
+    @pytest.fixture
+    def score_vectors(self):
+        """score_vector rows, many of them exactly on a rule threshold."""
+        rng = np.random.default_rng(0)
+        on_thresholds = rng.choice([0.3, 0.4, 0.5, 0.6, 0.7], size=(200, 9))
+        uniform = rng.random((200, 9))
+        return np.vstack([on_thresholds, uniform, np.ones((1, 9)), np.zeros((1, 9))])
+
+    @pytest.mark.parametrize("rules", [ISSUE_RULES, RECOMMENDATION_RULES])
+    def test_batch_masks_match_mask(self, rules, score_vectors):
+        """Test that batch_masks gives the same bitmask as mask for every row."""
+        expected = [rules.mask(tuple(row[:8])) for row in score_vectors.tolist()]
+
+        assert rules.batch_masks(score_vectors) == expected
+
+    def test_high_quality_scores_have_no_messages(self):
+        """Test that scores clearing every threshold share the empty result."""
+        scores = (0.9, 0.9, 0.9, 0.9, 0.1, 0.9, 0.9, 0.9)
+
+        assert _quality_issues(scores) is NO_MESSAGES
+        assert _quality_recommendations(scores) is NO_MESSAGES
+
+    def test_low_scores_fire_rules(self):
+        """Test that a score below its threshold yields that rule's message."""
+        scores = (0.9, 0.9, 0.9, 0.9, 0.1, 0.9, 0.9, 0.1)
+
+        assert _quality_issues(scores) == (
+            "Weak reasoning - lacks logical connections or justification",
+        )
+        assert _quality_recommendations(scores) == (
+            "Include logical connectors and causal relationships",
+        )